@@ -6,6 +6,8 @@ FastMCP's optimized tool execution and coordination capabilities.
 """
 
 from typing import Any, Dict, List, Optional, Callable
+import hashlib
+import json
 import logging
 import asyncio
 import time
@@ -367,15 +369,18 @@ class FastMCPAdapter(BaseFrameworkAdapter):
         return result
         
     def _generate_cache_key(self, tool_name: str, params: Dict[str, Any]) -> str:
-        """Generate cache key for tool execution."""
-        import hashlib
-        import json
+        """
+        Generate cache key for tool execution.
         
-        key_data = {
-            "tool": tool_name,
-            "params": params
-        }
-        key_str = json.dumps(key_data, sort_keys=True)
+        The key is always built from the live parameters, so a result is
+        never served for parameters that have since been edited in place.
+        
+        Args:
+            tool_name: Name of the tool
+            params: Tool parameters
+        """
+        params_json = json.dumps(params, sort_keys=True, default=str)
+        key_str = f"{tool_name}\x00{params_json}"
         return hashlib.md5(key_str.encode()).hexdigest()
         
     def _update_execution_stats(self, execution_time: float) -> None:
@@ -163,18 +163,27 @@ class AdapterRegistry:
                 
         return matching_adapters
         
-    async def health_check_all(self) -> Dict[str, Dict[str, Any]]:
+    async def health_check_all(self, max_concurrency: int = 8) -> Dict[str, Dict[str, Any]]:
         """
         Perform health check on all registered adapters.
         
+        Args:
+            max_concurrency: Maximum number of health checks in flight at once
+            
         Returns:
             Health status for all adapters
         """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def bounded_check(adapter: FrameworkAdapter) -> Dict[str, Any]:
+            async with semaphore:
+                return await adapter.health_check()
+                
         health_tasks = {}
         
         # Create health check tasks
         for name, adapter in self.adapters.items():
-            health_tasks[name] = adapter.health_check()
+            health_tasks[name] = bounded_check(adapter)
             
         # Execute health checks concurrently
         health_results = await asyncio.gather(
@@ -187,10 +196,11 @@ class AdapterRegistry:
         for i, (name, _) in enumerate(health_tasks.items()):
             result = health_results[i]
             
-            if isinstance(result, Exception):
+            # BaseException so a cancelled check is reported, not stored as its result
+            if isinstance(result, BaseException):
                 health_status[name] = {
                     "status": "unhealthy",
-                    "error": str(result)
+                    "error": str(result) or type(result).__name__
                 }
             else:
                 health_status[name] = result
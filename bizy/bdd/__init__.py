@@ -5,13 +5,14 @@ This module provides integration between Gherkin scenarios and the business logi
 orchestration system, allowing business rules to be defined in natural language.
 """
 
-from .gherkin_parser import GherkinRuleParser
+from .gherkin_parser import GherkinRuleParser, parse_feature_files_parallel
 from .scenario_executor import BDDScenarioExecutor
 from .documentation_generator import BDDDocumentationGenerator
 from .step_definitions import register_default_steps
 
 __all__ = [
     "GherkinRuleParser",
+    "parse_feature_files_parallel",
     "BDDScenarioExecutor", 
     "BDDDocumentationGenerator",
     "register_default_steps",
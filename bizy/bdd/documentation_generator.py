@@ -5,7 +5,7 @@ This module generates business-stakeholder-friendly documentation from BusinessR
 objects, creating living documentation that stays current with implementation.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
 from pathlib import Path
 import json
 from datetime import datetime
@@ -33,6 +33,11 @@ class BDDDocumentationGenerator:
         
     def generate_scenario(self, rule: BusinessRule) -> str:
         """Generate a Gherkin scenario from a BusinessRule."""
+        return self._scenario(rule, {})
+        
+    def _scenario(self, rule: BusinessRule, phrases: Dict[int, Tuple[List[str], List[str]]]) -> str:
+        """Render a scenario using the shared phrase cache."""
+        givens, thens = self._phrases(rule, phrases)
         scenario_lines = [f"  Scenario: {rule.name}"]
         
         # Add description as comment if available
@@ -40,8 +45,7 @@ class BDDDocumentationGenerator:
             scenario_lines.append(f"    # {rule.description}")
             
         # Generate Given statements from conditions
-        for i, condition in enumerate(rule.conditions):
-            given_text = self._condition_to_given(condition)
+        for i, given_text in enumerate(givens):
             keyword = "Given" if i == 0 else "And"
             scenario_lines.append(f"    {keyword} {given_text}")
             
@@ -50,8 +54,7 @@ class BDDDocumentationGenerator:
         scenario_lines.append(f"    When {when_statement}")
         
         # Generate Then statements from actions
-        for i, action in enumerate(rule.actions):
-            then_text = self._action_to_then(action)
+        for i, then_text in enumerate(thens):
             keyword = "Then" if i == 0 else "And"
             scenario_lines.append(f"    {keyword} {then_text}")
             
@@ -60,37 +63,77 @@ class BDDDocumentationGenerator:
     def generate_feature_file(self, rules: List[BusinessRule], feature_name: str, 
                             feature_description: str = None) -> str:
         """Generate a complete Gherkin feature file from multiple business rules."""
-        lines = [
-            f"Feature: {feature_name}"
-        ]
+        return self._feature_file(rules, feature_name, feature_description, {})
+        
+    def write_feature_file(self, writer: TextIO, rules: List[BusinessRule], feature_name: str,
+                           feature_description: str = None, max_chars: Optional[int] = None) -> int:
+        """
+        Stream a Gherkin feature file to a text writer.
+        
+        Writes the same text as generate_feature_file line by line, so callers
+        writing to a file or buffer never hold the whole document as a string.
+        
+        Args:
+            writer: Text stream to write to (file, io.StringIO, ...)
+            rules: Business rules to render as scenarios
+            feature_name: Name of the feature
+            feature_description: Optional feature description
+            max_chars: Stop after at least this many characters (for previews)
+            
+        Returns:
+            Number of characters written
+        """
+        written = 0
+        separator = ""
+        for line in self._feature_lines(rules, feature_name, feature_description, {}):
+            written += writer.write(separator)
+            written += writer.write(line)
+            separator = "\n"
+            if max_chars is not None and written >= max_chars:
+                break
+                
+        return written
+        
+    def _feature_file(self, rules: List[BusinessRule], feature_name: str,
+                      feature_description: Optional[str],
+                      phrases: Dict[int, Tuple[List[str], List[str]]]) -> str:
+        """Render a feature file using the shared phrase cache."""
+        return '\n'.join(self._feature_lines(rules, feature_name, feature_description, phrases))
+        
+    def _feature_lines(self, rules: List[BusinessRule], feature_name: str,
+                       feature_description: Optional[str],
+                       phrases: Dict[int, Tuple[List[str], List[str]]]) -> Iterator[str]:
+        """Yield the lines of a feature file one at a time."""
+        yield f"Feature: {feature_name}"
         
         if feature_description:
-            lines.extend([
-                f"  {line}" for line in feature_description.split('\n')
-            ])
+            for line in feature_description.split('\n'):
+                yield f"  {line}"
         else:
-            lines.append("  Business logic automation scenarios")
+            yield "  Business logic automation scenarios"
             
-        lines.append("")
+        yield ""
         
         # Group rules by type for better organization
         rule_groups = self._group_rules_by_type(rules)
         
         for rule_type, type_rules in rule_groups.items():
             if type_rules:
-                lines.append(f"  # {rule_type.title()} Rules")
-                lines.append("")
+                yield f"  # {rule_type.title()} Rules"
+                yield ""
                 
                 for rule in type_rules:
-                    scenario = self.generate_scenario(rule)
-                    lines.append(scenario)
-                    lines.append("")
+                    yield self._scenario(rule, phrases)
+                    yield ""
                     
-        return '\n'.join(lines)
-        
     def generate_business_process_documentation(self, rules: List[BusinessRule], 
                                               title: str = "Business Process Documentation") -> str:
         """Generate comprehensive business process documentation."""
+        return self._process_documentation(rules, title, {})
+        
+    def _process_documentation(self, rules: List[BusinessRule], title: str,
+                               phrases: Dict[int, Tuple[List[str], List[str]]]) -> str:
+        """Render process documentation using the shared phrase cache."""
         doc_lines = [
             f"# {title}",
             "",
@@ -130,7 +173,7 @@ class BDDDocumentationGenerator:
                 ])
                 
                 for rule in priority_groups[priority]:
-                    doc_lines.extend(self._generate_rule_documentation(rule))
+                    doc_lines.extend(self._generate_rule_documentation(rule, phrases))
                     doc_lines.append("")
                     
         # Framework usage section
@@ -149,6 +192,11 @@ class BDDDocumentationGenerator:
         
     def generate_stakeholder_summary(self, rules: List[BusinessRule]) -> str:
         """Generate an executive summary for business stakeholders."""
+        return self._stakeholder_summary(rules, {})
+        
+    def _stakeholder_summary(self, rules: List[BusinessRule],
+                             phrases: Dict[int, Tuple[List[str], List[str]]]) -> str:
+        """Render the stakeholder summary using the shared phrase cache."""
         total_rules = len(rules)
         high_priority = len([r for r in rules if r.priority in [RulePriority.CRITICAL, RulePriority.HIGH]])
         frameworks = set()
@@ -191,11 +239,35 @@ class BDDDocumentationGenerator:
             summary_lines.append(f"### {rule.name}")
             summary_lines.append(f"*Priority: {rule.priority.name}*")
             summary_lines.append("")
-            summary_lines.append(self._generate_plain_language_summary(rule))
+            summary_lines.append(self._generate_plain_language_summary(rule, phrases))
             summary_lines.append("")
             
         return '\n'.join(summary_lines)
         
+    def generate_all(self, rules: List[BusinessRule], title: str, feature_name: str,
+                     feature_description: str = None) -> Dict[str, str]:
+        """
+        Generate process documentation, stakeholder summary and feature file together.
+        
+        The natural language phrases for each rule's conditions and actions are
+        rendered once and shared by all three documents.
+        
+        Args:
+            rules: Business rules to document
+            title: Title of the business process documentation
+            feature_name: Name of the generated feature
+            feature_description: Optional description of the generated feature
+            
+        Returns:
+            Dictionary with 'process_doc', 'stakeholder_summary' and 'feature_file'
+        """
+        phrases: Dict[int, Tuple[List[str], List[str]]] = {}
+        return {
+            'process_doc': self._process_documentation(rules, title, phrases),
+            'stakeholder_summary': self._stakeholder_summary(rules, phrases),
+            'feature_file': self._feature_file(rules, feature_name, feature_description, phrases)
+        }
+        
     def _condition_to_given(self, condition: RuleCondition) -> str:
         """Convert a RuleCondition to natural language Given statement."""
         field_display = condition.field.replace('_', ' ').replace('.', ' ')
@@ -270,8 +342,11 @@ class BDDDocumentationGenerator:
             
         return groups
         
-    def _generate_rule_documentation(self, rule: BusinessRule) -> List[str]:
+    def _generate_rule_documentation(
+        self, rule: BusinessRule, phrases: Optional[Dict[int, Tuple[List[str], List[str]]]] = None
+    ) -> List[str]:
         """Generate detailed documentation for a single rule."""
+        givens, thens = self._phrases(rule, phrases if phrases is not None else {})
         lines = [
             f"### {rule.name}",
             f"**Type**: {rule.rule_type.value.title()}  ",
@@ -283,17 +358,15 @@ class BDDDocumentationGenerator:
             
         lines.append("")
         lines.append("**Conditions**:")
-        if rule.conditions:
-            for condition in rule.conditions:
-                condition_text = self._condition_to_given(condition)
+        if givens:
+            for condition_text in givens:
                 lines.append(f"- {condition_text}")
         else:
             lines.append("- Always execute (no conditions)")
             
         lines.append("")
         lines.append("**Actions**:")
-        for action in rule.actions:
-            action_text = self._action_to_then(action)
+        for action_text in thens:
             lines.append(f"- {action_text}")
             
         if rule.metadata and rule.metadata.get('source') != 'gherkin':
@@ -359,28 +432,34 @@ class BDDDocumentationGenerator:
                 
         return patterns
         
-    def _generate_plain_language_summary(self, rule: BusinessRule) -> str:
+    def _generate_plain_language_summary(
+        self, rule: BusinessRule, phrases: Optional[Dict[int, Tuple[List[str], List[str]]]] = None
+    ) -> str:
         """Generate a plain language summary of what the rule does."""
+        givens, thens = self._phrases(rule, phrases if phrases is not None else {})
         lines = []
         
-        if rule.conditions:
-            condition_summaries = []
-            for condition in rule.conditions:
-                condition_text = self._condition_to_given(condition)
-                condition_summaries.append(condition_text)
-            lines.append(f"When {' and '.join(condition_summaries)}, ")
+        if givens:
+            lines.append(f"When {' and '.join(givens)}, ")
         else:
             lines.append("Whenever triggered, ")
             
-        action_summaries = []
-        for action in rule.actions:
-            action_text = self._action_to_then(action)
-            action_summaries.append(action_text)
-            
-        lines.append(f"the system will {', then '.join(action_summaries)}.")
+        lines.append(f"the system will {', then '.join(thens)}.")
         
         return ''.join(lines)
         
+    def _phrases(self, rule: BusinessRule,
+                 cache: Dict[int, Tuple[List[str], List[str]]]) -> Tuple[List[str], List[str]]:
+        """Get a rule's Given and Then phrases, rendering them at most once per cache."""
+        key = id(rule)
+        phrases = cache.get(key)
+        if phrases is None:
+            phrases = cache[key] = (
+                [self._condition_to_given(condition) for condition in rule.conditions],
+                [self._action_to_then(action) for action in rule.actions]
+            )
+        return phrases
+        
     def export_to_file(self, content: str, file_path: Path, format: str = "markdown") -> None:
         """Export documentation to a file."""
         if format.lower() == "markdown":
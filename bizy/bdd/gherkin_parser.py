@@ -5,13 +5,23 @@ This module parses Gherkin feature files and converts scenarios into executable
 BusinessRule objects that can be processed by the MetaOrchestrator.
 """
 
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from concurrent.futures import ProcessPoolExecutor
+import os
 import re
 import yaml
 from pathlib import Path
 
 from ..core.business_rule import BusinessRule, RuleCondition, RuleAction, RuleType, RulePriority
 
+# Matches the start of a scenario block at the beginning of a line
+_SCENARIO_HEADER_RE = re.compile(r'\s*Scenario(?:\s+Outline)?:')
+
+# Classifies a stripped scenario line by its leading token; the matched
+# group (lastindex) selects the section: examples header, table row or step
+_EXAMPLES, _TABLE_ROW, _STEP = 1, 2, 3
+_SCENARIO_LINE_RE = re.compile(r'(Examples:)|(\|)|(Given|When|Then|And|But)')
+
 
 class GherkinRuleParser:
     """
@@ -100,39 +110,44 @@ class GherkinRuleParser:
         
     def parse_feature_file(self, feature_path: Path) -> List[BusinessRule]:
         """Parse a Gherkin feature file into business rules."""
-        rules = []
+        return list(self.iter_scenarios(feature_path))
         
-        with open(feature_path, 'r') as f:
-            content = f.read()
-            
-        scenarios = self._extract_scenarios(content)
+    def iter_scenarios(self, feature_path: Path, buffer_size: int = 65536) -> Iterator[BusinessRule]:
+        """
+        Lazily parse a Gherkin feature file, yielding rules one scenario at a time.
+        
+        The file is read line by line and each rule is yielded as soon as its
+        scenario block closes, so only a single scenario is held in memory.
+        """
+        block: Optional[List[str]] = None
         
-        for scenario in scenarios:
-            rule = self._scenario_to_rule(scenario)
+        with open(feature_path, 'r', buffering=buffer_size) as f:
+            for line in f:
+                header = _SCENARIO_HEADER_RE.match(line)
+                if header:
+                    if block is not None:
+                        rule = self._block_to_rule(block)
+                        if rule:
+                            yield rule
+                    block = [line[header.end():]]
+                elif block is not None:
+                    block.append(line)
+                    
+        if block is not None:
+            rule = self._block_to_rule(block)
             if rule:
-                rules.append(rule)
+                yield rule
                 
-        return rules
+    def _block_to_rule(self, block: List[str]) -> Optional[BusinessRule]:
+        """Convert the buffered lines of one scenario block to a rule."""
+        scenario = self._parse_scenario_block(''.join(block))
+        return self._scenario_to_rule(scenario)
         
     def parse_scenario_text(self, scenario_text: str) -> Optional[BusinessRule]:
         """Parse a single Gherkin scenario from text."""
         scenario = self._parse_scenario_block(scenario_text)
         return self._scenario_to_rule(scenario) if scenario else None
         
-    def _extract_scenarios(self, content: str) -> List[Dict[str, Any]]:
-        """Extract individual scenarios from feature file content."""
-        scenarios = []
-        
-        # Split by scenario headers
-        scenario_blocks = re.split(r'\n\s*Scenario(?:\s+Outline)?:', content)
-        
-        for block in scenario_blocks[1:]:  # Skip feature header
-            scenario = self._parse_scenario_block(block)
-            if scenario:
-                scenarios.append(scenario)
-                
-        return scenarios
-        
     def _parse_scenario_block(self, block: str) -> Optional[Dict[str, Any]]:
         """Parse a single scenario block."""
         lines = block.strip().split('\n')
@@ -150,18 +165,19 @@ class GherkinRuleParser:
         current_section = 'steps'
         current_table = []
         
+        match_line = _SCENARIO_LINE_RE.match
+        
         for line in lines[1:]:
             line = line.strip()
             
-            if not line:
+            match = match_line(line)
+            if not match:
                 continue
                 
-            if line.startswith('Examples:'):
+            kind = match.lastindex
+            if kind == _EXAMPLES:
                 current_section = 'examples'
-                continue
-            elif line.startswith('|') and current_section == 'examples':
-                scenario['examples'].append(self._parse_table_row(line))
-            elif line.startswith(('Given', 'When', 'Then', 'And', 'But')):
+            elif kind == _STEP:
                 # Check if previous step had a table
                 if current_table and scenario['steps']:
                     scenario['steps'][-1]['table'] = current_table
@@ -169,7 +185,9 @@ class GherkinRuleParser:
                     
                 scenario['steps'].append(self._parse_step(line))
                 current_section = 'steps'
-            elif line.startswith('|') and current_section == 'steps':
+            elif current_section == 'examples':
+                scenario['examples'].append(self._parse_table_row(line))
+            else:
                 current_table.append(self._parse_table_row(line))
                 
         # Handle final table
@@ -353,13 +371,39 @@ class GherkinRuleParser:
             return RuleType.CONDITION
 
 
-class ScenarioTemplateGenerator:
-    """Generates Gherkin scenario templates for common business patterns."""
+def _parse_feature_path(path: str) -> List[BusinessRule]:
+    """Parse one feature file in a worker process."""
+    return GherkinRuleParser().parse_feature_file(Path(path))
+
+
+def parse_feature_files_parallel(
+    paths: List[Union[str, Path]], max_workers: Optional[int] = None
+) -> List[List[BusinessRule]]:
+    """
+    Parse several feature files across worker processes.
     
-    @staticmethod
-    def generate_customer_service_template() -> str:
-        """Generate customer service automation template."""
-        return '''Feature: Customer Service Automation
+    Gherkin parsing is CPU-bound, so files are spread over a process pool
+    rather than threads. A single file is parsed in-process.
+    
+    Args:
+        paths: Feature files to parse
+        max_workers: Maximum number of worker processes (defaults to CPU count)
+        
+    Returns:
+        Parsed rules for each file, in the same order as paths
+    """
+    paths = [str(path) for path in paths]
+    if len(paths) <= 1:
+        return [_parse_feature_path(path) for path in paths]
+        
+    workers = max_workers or os.cpu_count() or 1
+    chunksize = max(1, len(paths) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_parse_feature_path, paths, chunksize=chunksize))
+
+
+# Templates are fixed text, so they are built once at import time
+_CUSTOMER_SERVICE_TEMPLATE = '''Feature: Customer Service Automation
   As a customer service manager
   I want automated escalation for unhappy premium customers
   So that we retain high-value accounts
@@ -373,10 +417,7 @@ class ScenarioTemplateGenerator:
     And update customer context in Zep memory
 '''
 
-    @staticmethod
-    def generate_document_processing_template() -> str:
-        """Generate document processing template."""
-        return '''Feature: Enterprise Document Processing
+_DOCUMENT_PROCESSING_TEMPLATE = '''Feature: Enterprise Document Processing
   As a compliance officer
   I want automated document analysis and routing
   So that legal reviews are comprehensive and timely
@@ -392,10 +433,7 @@ class ScenarioTemplateGenerator:
     And the workflow should complete within 5 minutes
 '''
 
-    @staticmethod
-    def generate_data_pipeline_template() -> str:
-        """Generate data processing pipeline template."""
-        return '''Feature: Multi-Source Data Integration
+_DATA_PIPELINE_TEMPLATE = '''Feature: Multi-Source Data Integration
   As a data analyst
   I want coordinated data processing across AI tools
   So that insights are accurate and timely
@@ -409,3 +447,22 @@ class ScenarioTemplateGenerator:
     And Zep should store processing context
     And all frameworks should coordinate successfully
 '''
+
+
+class ScenarioTemplateGenerator:
+    """Generates Gherkin scenario templates for common business patterns."""
+    
+    @staticmethod
+    def generate_customer_service_template() -> str:
+        """Generate customer service automation template."""
+        return _CUSTOMER_SERVICE_TEMPLATE
+
+    @staticmethod
+    def generate_document_processing_template() -> str:
+        """Generate document processing template."""
+        return _DOCUMENT_PROCESSING_TEMPLATE
+
+    @staticmethod
+    def generate_data_pipeline_template() -> str:
+        """Generate data processing pipeline template."""
+        return _DATA_PIPELINE_TEMPLATE
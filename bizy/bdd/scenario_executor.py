@@ -12,11 +12,14 @@ from pathlib import Path
 import logging
 
 from ..core.meta_orchestrator import MetaOrchestrator
-from ..core.business_rule import BusinessRule
+from ..core.business_rule import BusinessRule, RuleCondition
 from .gherkin_parser import GherkinRuleParser
 
 logger = logging.getLogger(__name__)
 
+# Marks a field path that has not been resolved yet (None is a valid value)
+_MISSING = object()
+
 
 class BDDScenarioExecutor:
     """
@@ -84,6 +87,113 @@ class BDDScenarioExecutor:
                 'skipped': False
             }
         
+    async def execute_business_rules_batch(self, rules: List[BusinessRule], context: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Execute several business rules against the same context in one pass.
+        
+        Each distinct condition field is resolved from the context once and
+        shared across all rules, and the rules whose conditions pass are
+        dispatched to the orchestrator concurrently.
+        
+        Args:
+            rules: Business rules to evaluate and execute
+            context: Execution context shared by all rules
+            
+        Returns:
+            Summary in the same shape as feature file execution results
+        """
+        context = context or {}
+        results = {
+            'source': 'rule_batch',
+            'scenarios_executed': 0,
+            'scenarios_passed': 0,
+            'scenarios_failed': 0,
+            'scenarios_skipped': 0,
+            'total_execution_time': 0,
+            'details': []
+        }
+        
+        start_time = asyncio.get_event_loop().time()
+        
+        # Evaluate all condition trees, resolving each field only once
+        resolved: Dict[str, Any] = {}
+        scenario_results: List[Optional[Dict[str, Any]]] = []
+        matched = []
+        for rule in rules:
+            try:
+                if self._conditions_met(rule, context, resolved):
+                    scenario_results.append(None)
+                    matched.append(rule)
+                else:
+                    logger.info(f"Rule {rule.name} conditions not met, skipping")
+                    scenario_results.append(self._skipped_result(rule))
+            except Exception as e:
+                logger.error(f"Exception during rule execution: {e}")
+                scenario_results.append(self._error_result(rule, e))
+                
+        # Dispatch matching rules concurrently
+        dispatched = await asyncio.gather(
+            *[self._dispatch_rule(rule, context) for rule in matched],
+            return_exceptions=True
+        )
+        dispatched_iter = iter(zip(matched, dispatched))
+        for i, scenario_result in enumerate(scenario_results):
+            if scenario_result is None:
+                rule, outcome = next(dispatched_iter)
+                # BaseException so a cancelled rule becomes an error result
+                if isinstance(outcome, BaseException):
+                    logger.error(f"Exception during rule execution: {outcome!r}")
+                    outcome = self._error_result(rule, outcome)
+                scenario_results[i] = outcome
+                
+        for rule, scenario_result in zip(rules, scenario_results):
+            results['scenarios_executed'] += 1
+            
+            if scenario_result.get('skipped', False):
+                results['scenarios_skipped'] += 1
+            elif scenario_result.get('success', False):
+                results['scenarios_passed'] += 1
+            else:
+                results['scenarios_failed'] += 1
+                
+            results['details'].append({
+                'rule_name': rule.name,
+                'rule_id': rule.id,
+                'result': scenario_result
+            })
+            
+        results['total_execution_time'] = asyncio.get_event_loop().time() - start_time
+        results['success'] = results['scenarios_failed'] == 0
+        
+        # Store in execution history
+        self.execution_history.append(results)
+        
+        return results
+        
+    def _conditions_met(self, rule: BusinessRule, context: Dict[str, Any], resolved: Dict[str, Any]) -> bool:
+        """Check a rule's conditions, reusing field values already resolved from the context."""
+        try:
+            return self._check_conditions(rule.ordered_conditions(), context, resolved)
+        except Exception:
+            # A reordered comparison can raise on a value that an earlier
+            # declared condition would have rejected; declaration order
+            # decides the result
+            return self._check_conditions(rule.conditions, context, resolved)
+            
+    @staticmethod
+    def _check_conditions(
+        conditions: List[RuleCondition], context: Dict[str, Any], resolved: Dict[str, Any]
+    ) -> bool:
+        """Check conditions in the given order, stopping at the first failure."""
+        for condition in conditions:
+            value = resolved.get(condition.field, _MISSING)
+            if value is _MISSING:
+                value = resolved[condition.field] = condition.resolve(context)
+            if not condition.compare(value):
+                return False
+                
+        return True
+        
     async def _execute_rules(self, rules: List[BusinessRule], context: Dict[str, Any], source: str) -> Dict[str, Any]:
         """Execute a list of business rules."""
         results = {
@@ -135,46 +245,58 @@ class BDDScenarioExecutor:
             # Check if rule conditions are met
             if not rule.should_execute(context):
                 logger.info(f"Rule {rule.name} conditions not met, skipping")
-                return {
-                    'success': True,
-                    'skipped': True,
-                    'reason': 'Conditions not met',
-                    'conditions_evaluated': len(rule.conditions),
-                    'actions_planned': len(rule.actions)
-                }
+                return self._skipped_result(rule)
                 
-            # Execute rule through orchestrator
-            logger.info(f"Executing rule {rule.name} with {len(rule.actions)} actions")
-            execution_result = await self.orchestrator.execute_rule(rule, context)
-            
-            # Analyze execution results
-            success = self._analyze_execution_success(execution_result)
-            
-            result = {
-                'success': success,
-                'skipped': False,
-                'conditions_evaluated': len(rule.conditions),
-                'actions_executed': len(rule.actions),
-                'frameworks_involved': list(execution_result.keys()),
-                'execution_details': execution_result
-            }
-            
-            if success:
-                logger.info(f"Rule {rule.name} executed successfully")
-            else:
-                logger.warning(f"Rule {rule.name} execution had failures")
-                
-            return result
+            return await self._dispatch_rule(rule, context)
             
         except Exception as e:
             logger.error(f"Exception during rule execution: {e}")
-            return {
-                'success': False,
-                'skipped': False,
-                'error': str(e),
-                'conditions_evaluated': len(rule.conditions),
-                'actions_planned': len(rule.actions)
-            }
+            return self._error_result(rule, e)
+            
+    async def _dispatch_rule(self, rule: BusinessRule, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute a rule whose conditions are already known to be met."""
+        # Execute rule through orchestrator
+        logger.info(f"Executing rule {rule.name} with {len(rule.actions)} actions")
+        execution_result = await self.orchestrator.execute_rule(rule, context)
+        
+        # Analyze execution results
+        success = self._analyze_execution_success(execution_result)
+        
+        result = {
+            'success': success,
+            'skipped': False,
+            'conditions_evaluated': len(rule.conditions),
+            'actions_executed': len(rule.actions),
+            'frameworks_involved': list(execution_result.keys()),
+            'execution_details': execution_result
+        }
+        
+        if success:
+            logger.info(f"Rule {rule.name} executed successfully")
+        else:
+            logger.warning(f"Rule {rule.name} execution had failures")
+            
+        return result
+        
+    def _skipped_result(self, rule: BusinessRule) -> Dict[str, Any]:
+        """Result for a rule whose conditions were not met."""
+        return {
+            'success': True,
+            'skipped': True,
+            'reason': 'Conditions not met',
+            'conditions_evaluated': len(rule.conditions),
+            'actions_planned': len(rule.actions)
+        }
+        
+    def _error_result(self, rule: BusinessRule, error: BaseException) -> Dict[str, Any]:
+        """Result for a rule whose evaluation or execution raised or was cancelled."""
+        return {
+            'success': False,
+            'skipped': False,
+            'error': str(error) or type(error).__name__,
+            'conditions_evaluated': len(rule.conditions),
+            'actions_planned': len(rule.actions)
+        }
             
     def _analyze_execution_success(self, execution_result: Dict[str, Any]) -> bool:
         """Analyze execution results to determine overall success."""
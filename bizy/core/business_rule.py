@@ -7,8 +7,12 @@ that can be executed across multiple AI frameworks.
 
 from typing import Any, Dict, List, Optional, Union
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from enum import Enum
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from enum import Enum, IntEnum
+from itertools import compress, repeat
+import heapq
+import operator
 import uuid
 
 
@@ -20,7 +24,7 @@ class RuleType(Enum):
     POLICY = "policy"
 
 
-class RulePriority(Enum):
+class RulePriority(IntEnum):
     """Priority levels for rule execution."""
     LOW = 1
     MEDIUM = 5
@@ -28,6 +32,33 @@ class RulePriority(Enum):
     CRITICAL = 15
 
 
+# Sentinel for path segments absent from the context
+_MISSING = object()
+
+
+def _is_in(field_value: Any, value: Any) -> bool:
+    return field_value in value
+
+
+def _is_not_in(field_value: Any, value: Any) -> bool:
+    return field_value not in value
+
+
+# Comparison callables for each supported operator, called as op(field_value, value).
+# Module-level functions keep conditions picklable for process pools.
+_OPERATORS = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "lt": operator.lt,
+    "gte": operator.ge,
+    "lte": operator.le,
+    "in": _is_in,
+    "not_in": _is_not_in,
+    "contains": operator.contains,
+}
+
+
 @dataclass
 class RuleCondition:
     """Represents a condition that must be met for rule execution."""
@@ -35,40 +66,70 @@ class RuleCondition:
     operator: str  # eq, ne, gt, lt, gte, lte, in, not_in, contains, etc.
     value: Any
 
+    def __post_init__(self):
+        # Split the dotted path once so evaluation never re-splits it
+        self._path_parts = tuple(self.field.split("."))
+        # Top-level fields skip the path walk entirely
+        self._key = self.field if len(self._path_parts) == 1 else None
+        # Relative evaluation cost: equality checks on top-level fields are
+        # cheapest, ordering/membership operators and nested paths cost more
+        self._cost = (
+            (2 if len(self._path_parts) > 1 else 0)
+            + (0 if self.operator in ("eq", "ne") else 1)
+        )
+        # Resolve the operator once; unknown operators still fail on evaluation
+        self._op = _OPERATORS.get(self.operator, self._unsupported_operator)
+
     def evaluate(self, context: Dict[str, Any]) -> bool:
         """Evaluate the condition against the provided context."""
-        field_value = self._get_field_value(context, self.field)
-
-        if self.operator == "eq":
-            return field_value == self.value
-        elif self.operator == "ne":
-            return field_value != self.value
-        elif self.operator == "gt":
-            return field_value > self.value
-        elif self.operator == "lt":
-            return field_value < self.value
-        elif self.operator == "gte":
-            return field_value >= self.value
-        elif self.operator == "lte":
-            return field_value <= self.value
-        elif self.operator == "in":
-            return field_value in self.value
-        elif self.operator == "not_in":
-            return field_value not in self.value
-        elif self.operator == "contains":
-            return self.value in field_value
-        else:
-            raise ValueError(f"Unsupported operator: {self.operator}")
+        return self._op(self.resolve(context), self.value)
+
+    def resolve(self, context: Dict[str, Any]) -> Any:
+        """Extract this condition's field value from the context."""
+        if self._key is not None:
+            return context.get(self._key) if isinstance(context, dict) else None
+        return self._walk(context, self._path_parts)
+
+    def resolve_column(self, contexts: List[Dict[str, Any]]) -> List[Any]:
+        """Extract this condition's field value from each of many contexts."""
+        if self._key is not None:
+            try:
+                return list(map(dict.get, contexts, repeat(self._key)))
+            except TypeError:
+                # Some context is not a dict; resolve row by row
+                pass
+        return [self.resolve(context) for context in contexts]
+
+    def compare(self, field_value: Any) -> bool:
+        """Apply the operator to an already-resolved field value."""
+        return self._op(field_value, self.value)
+
+    def compare_column(self, field_values: List[Any]) -> List[bool]:
+        """
+        Apply the operator to a column of already-resolved field values.
+
+        The operator is mapped over the column directly, so built-in
+        comparisons run without a Python-level call per value.
+        """
+        return list(map(self._op, field_values, repeat(self.value)))
+
+    def _unsupported_operator(self, field_value: Any, value: Any) -> bool:
+        raise ValueError(f"Unsupported operator: {self.operator}")
 
     def _get_field_value(self, context: Dict[str, Any], field: str) -> Any:
         """Extract field value from context, supporting nested field access."""
-        parts = field.split(".")
+        return self._walk(context, field.split("."))
+
+    @staticmethod
+    def _walk(context: Dict[str, Any], parts) -> Any:
+        """Follow pre-split path parts through nested dictionaries."""
         value = context
 
         for part in parts:
-            if isinstance(value, dict) and part in value:
-                value = value[part]
-            else:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(part, _MISSING)
+            if value is _MISSING:
                 return None
 
         return value
@@ -82,6 +143,7 @@ class RuleAction:
     parameters: Dict[str, Any]
     timeout: Optional[float] = None
     retry_count: int = 0
+    depends_on: List[str] = field(default_factory=list)  # names of actions that must run first
 
 
 class BusinessRule:
@@ -94,6 +156,11 @@ class BusinessRule:
     - Metadata for rule management and coordination
     """
 
+    # Maximum number of memoized should_execute results kept per rule
+    CONDITION_CACHE_SIZE = 1024
+    # Evaluations between re-sorting conditions by observed selectivity
+    REORDER_INTERVAL = 1024
+
     def __init__(
         self,
         name: str,
@@ -102,9 +169,10 @@ class BusinessRule:
         conditions: Optional[List[RuleCondition]] = None,
         actions: Optional[List[RuleAction]] = None,
         description: Optional[str] = None,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        rule_id: Optional[str] = None
     ):
-        self.id = str(uuid.uuid4())
+        self.id = rule_id or str(uuid.uuid4())
         self.name = name
         self.rule_type = rule_type
         self.priority = priority
@@ -112,6 +180,25 @@ class BusinessRule:
         self.actions = actions or []
         self.description = description
         self.metadata = metadata or {}
+        self._condition_plan_key = None
+        self._condition_plan: List[RuleCondition] = []
+        self._cond_cache: "OrderedDict[tuple, bool]" = OrderedDict()
+        self._field_resolvers: List[RuleCondition] = []
+        self._condition_slots: List[int] = []
+        self._declared_slots: List[tuple] = []  # (condition, slot) in declaration order
+        self._condition_stats: List[List[int]] = []  # [calls, passes] per planned condition
+        self._evaluations = 0
+
+    @property
+    def priority(self) -> RulePriority:
+        """Execution priority of the rule."""
+        return self._priority
+
+    @priority.setter
+    def priority(self, priority: RulePriority) -> None:
+        self._priority = priority
+        # Plain int for sort keys, read without going through the enum
+        self._priority_key = int(priority)
 
     def should_execute(self, context: Dict[str, Any]) -> bool:
         """
@@ -126,13 +213,175 @@ class BusinessRule:
         if not self.conditions:
             return True
 
-        # All conditions must be met for rule execution
+        # Results are memoized on the values of the referenced fields only,
+        # so contexts that differ elsewhere share one evaluation
+        conditions = self.ordered_conditions()
+        # Each distinct field is pulled from the context once, even when
+        # several conditions reference it
+        values = tuple([resolver.resolve(context) for resolver in self._field_resolvers])
+        # Types are part of the key: 1, 1.0 and True hash alike but can
+        # compare differently (e.g. against "in" lists or strings)
+        key = values + tuple(map(type, values))
+        cache = self._cond_cache
+        try:
+            result = cache[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable field values are evaluated directly
+            return self._conditions_met(conditions, values)
+        else:
+            cache.move_to_end(key)
+            return result
+
+        result = cache[key] = self._conditions_met(conditions, values)
+        if len(cache) > self.CONDITION_CACHE_SIZE:
+            # Evict the least recently used entry
+            cache.popitem(last=False)
+
+        self._evaluations += 1
+        if self._evaluations >= self.REORDER_INTERVAL:
+            self._reorder_conditions()
+        return result
+
+    def cache_clear(self) -> None:
+        """Drop memoized should_execute results, e.g. when the rule is re-registered."""
+        self._cond_cache.clear()
+
+    def invalidate(self) -> None:
+        """
+        Drop memoized condition results.
+
+        Call this after mutating a condition in place (e.g. changing its
+        field, operator or value); adding, removing or replacing conditions
+        is detected automatically.
+        """
         for condition in self.conditions:
-            if not condition.evaluate(context):
+            condition.__post_init__()
+        self.cache_clear()
+        self._condition_plan_key = None
+
+    def _conditions_met(self, conditions: List[RuleCondition], values: tuple) -> bool:
+        """Check resolved field values against conditions, stopping at the first failure."""
+        # All conditions must be met for rule execution, so check the
+        # cheapest ones first and stop at the first failure
+        try:
+            for condition, slot, stats in zip(conditions, self._condition_slots, self._condition_stats):
+                stats[0] += 1
+                if not condition.compare(values[slot]):
+                    return False
+                stats[1] += 1
+        except Exception:
+            # A reordered comparison can raise on a value that an earlier
+            # declared condition (a guard) would have rejected
+            return self._conditions_met_in_order(values)
+
+        return True
+
+    def _conditions_met_in_order(self, values: tuple) -> bool:
+        """
+        Check resolved field values against conditions in declaration order.
+
+        This is the reference semantics: it returns False at the first
+        failing condition and raises only if a condition reached in that
+        order raises.
+        """
+        for condition, slot in self._declared_slots:
+            if not condition.compare(values[slot]):
                 return False
 
         return True
 
+    def _reorder_conditions(self) -> None:
+        """
+        Re-sort the condition plan using the pass rates observed so far.
+
+        Conditions stay grouped by estimated cost; within a cost tier the
+        ones that fail most often move to the front so they short-circuit
+        the rest. Counters restart afterwards so the order keeps adapting.
+        """
+        def sort_key(entry):
+            condition, _, (calls, passes) = entry
+            return (condition._cost, passes / calls if calls else 1.0)
+
+        plan = sorted(
+            zip(self._condition_plan, self._condition_slots, self._condition_stats),
+            key=sort_key
+        )
+        self._condition_plan = [condition for condition, _, _ in plan]
+        self._condition_slots = [slot for _, slot, _ in plan]
+        self._condition_stats = [[0, 0] for _ in plan]
+        self._evaluations = 0
+
+    def evaluate_batch(self, contexts: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Evaluate the rule's conditions against many contexts at once.
+
+        Conditions are applied column by column, cheapest first, and each
+        condition only looks at the contexts that passed the previous ones.
+
+        Args:
+            contexts: Execution contexts to evaluate
+
+        Returns:
+            One flag per context, True where all conditions are met
+        """
+        matching = range(len(contexts))
+        try:
+            for condition in self.ordered_conditions():
+                if not matching:
+                    break
+                column = condition.resolve_column([contexts[i] for i in matching])
+                matching = list(compress(matching, condition.compare_column(column)))
+        except Exception:
+            # Some row fails a comparison that its guard conditions would have
+            # short-circuited; evaluate row by row in declaration order
+            resolvers = self._field_resolvers
+            return [
+                self._conditions_met_in_order(tuple([r.resolve(context) for r in resolvers]))
+                for context in contexts
+            ]
+
+        mask = [False] * len(contexts)
+        for i in matching:
+            mask[i] = True
+        return mask
+
+    def ordered_conditions(self) -> List[RuleCondition]:
+        """
+        Get the rule's conditions ordered cheapest first.
+
+        The ordering is cached and rebuilt whenever a condition is added,
+        removed or replaced. Every REORDER_INTERVAL evaluations,
+        conditions of equal cost are re-sorted by how often they fail.
+
+        Returns:
+            Conditions sorted by estimated evaluation cost
+        """
+        # The plan holds references to these conditions, so their ids cannot
+        # be reused by new objects while the key is live
+        key = tuple(map(id, self.conditions))
+        if key != self._condition_plan_key:
+            self._condition_plan = sorted(self.conditions, key=lambda c: c._cost)
+            self._condition_plan_key = key
+            self.cache_clear()
+
+            # Group conditions by field: one resolver per distinct field and,
+            # for each ordered condition, the slot holding its field's value
+            slots: Dict[str, int] = {}
+            self._field_resolvers = []
+            self._condition_slots = []
+            for condition in self._condition_plan:
+                if condition.field not in slots:
+                    slots[condition.field] = len(self._field_resolvers)
+                    self._field_resolvers.append(condition)
+                self._condition_slots.append(slots[condition.field])
+            self._declared_slots = [(condition, slots[condition.field]) for condition in self.conditions]
+
+            self._condition_stats = [[0, 0] for _ in self._condition_plan]
+            self._evaluations = 0
+        return self._condition_plan
+
     def get_applicable_actions(self, frameworks: List[str]) -> List[RuleAction]:
         """
         Get actions that can be executed on the provided frameworks.
@@ -172,7 +421,8 @@ class BusinessRule:
                     "action": a.action,
                     "parameters": a.parameters,
                     "timeout": a.timeout,
-                    "retry_count": a.retry_count
+                    "retry_count": a.retry_count,
+                    "depends_on": list(a.depends_on)
                 }
                 for a in self.actions
             ],
@@ -198,43 +448,49 @@ class BusinessRule:
                 action=action_data["action"],
                 parameters=action_data["parameters"],
                 timeout=action_data.get("timeout"),
-                retry_count=action_data.get("retry_count", 0)
+                retry_count=action_data.get("retry_count", 0),
+                depends_on=list(action_data.get("depends_on", []))
             ))
 
-        rule = cls(
+        # A provided ID is passed through so no throwaway UUID is generated
+        return cls(
             name=data["name"],
             rule_type=RuleType(data.get("rule_type", "condition")),
             priority=RulePriority(data.get("priority", 5)),
             conditions=conditions,
             actions=actions,
             description=data.get("description"),
-            metadata=data.get("metadata", {})
+            metadata=data.get("metadata", {}),
+            rule_id=data.get("id")
         )
 
-        # Set ID if provided
-        if "id" in data:
-            rule.id = data["id"]
 
-        return rule
+_by_priority = operator.attrgetter("_priority_key")
 
 
 class RuleConflictResolver:
     """Resolves conflicts between multiple business rules."""
 
     @staticmethod
-    def resolve_conflicts(rules: List[BusinessRule]) -> List[BusinessRule]:
+    def resolve_conflicts(rules: List[BusinessRule], top_k: Optional[int] = None) -> List[BusinessRule]:
         """
         Resolve conflicts between rules based on priority and rule type.
 
         Args:
             rules: List of potentially conflicting rules
+            top_k: Optional number of highest-priority rules to return.
+                Selecting only these is O(n log k) instead of a full sort.
 
         Returns:
             List of rules with conflicts resolved
         """
+        if top_k is not None:
+            # nlargest keeps the input order among equal priorities, like
+            # the stable sort below
+            return heapq.nlargest(top_k, rules, key=_by_priority)
+
         # Sort by priority (highest first)
-        sorted_rules = sorted(
-            rules, key=lambda r: r.priority.value, reverse=True)
+        sorted_rules = sorted(rules, key=_by_priority, reverse=True)
 
         # For now, simple priority-based resolution
         # More sophisticated conflict resolution can be added later
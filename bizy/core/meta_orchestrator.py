@@ -5,9 +5,10 @@ This module provides the central orchestration layer that coordinates business
 rule execution across multiple AI frameworks.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from abc import ABC, abstractmethod
 import asyncio
+import itertools
 import logging
 
 from .business_rule import BusinessRule
@@ -29,6 +30,13 @@ class MetaOrchestrator:
         self.adapters: Dict[str, FrameworkAdapter] = {}
         self.event_bus = event_bus or EventBus()
         self.active_rules: List[BusinessRule] = []
+        # Rules indexed by a top-level context field they require (see
+        # register_rule); rules without such a field are always candidates
+        self._rules_by_field: Dict[str, List[BusinessRule]] = {}
+        self._unindexed_rules: List[BusinessRule] = []
+        # rule id -> (registration sequence, index field)
+        self._rule_index: Dict[str, Tuple[int, Optional[str]]] = {}
+        self._rule_sequence = itertools.count()
         
     def register_adapter(self, name: str, adapter: FrameworkAdapter) -> None:
         """Register a framework adapter for business rule execution."""
@@ -41,6 +49,112 @@ class MetaOrchestrator:
             del self.adapters[name]
             logger.info(f"Unregistered adapter: {name}")
             
+    def register_rule(self, rule: BusinessRule) -> None:
+        """
+        Register a business rule for context matching.
+        
+        The rule is indexed under the top-level field of its first equality
+        condition against a non-None value: a context without that field
+        resolves it to None, so the rule cannot match and is skipped without
+        being evaluated. Re-register a rule after changing its conditions.
+        """
+        self.unregister_rule(rule.id)
+        self.active_rules.append(rule)
+        
+        key_field = self._index_field(rule)
+        self._rule_index[rule.id] = (next(self._rule_sequence), key_field)
+        if key_field is None:
+            self._unindexed_rules.append(rule)
+        else:
+            self._rules_by_field.setdefault(key_field, []).append(rule)
+            
+    def unregister_rule(self, rule_id: str) -> None:
+        """Remove a registered business rule by ID."""
+        entry = self._rule_index.pop(rule_id, None)
+        if entry is None:
+            return
+            
+        _, key_field = entry
+        self.active_rules[:] = [r for r in self.active_rules if r.id != rule_id]
+        if key_field is None:
+            self._unindexed_rules[:] = [r for r in self._unindexed_rules if r.id != rule_id]
+        else:
+            bucket = [r for r in self._rules_by_field.get(key_field, []) if r.id != rule_id]
+            if bucket:
+                self._rules_by_field[key_field] = bucket
+            else:
+                self._rules_by_field.pop(key_field, None)
+                
+    @staticmethod
+    def _index_field(rule: BusinessRule) -> Optional[str]:
+        """Get the top-level context field a rule cannot match without."""
+        for condition in rule.conditions:
+            if condition.operator == "eq" and condition.value is not None:
+                return condition._path_parts[0]
+        return None
+        
+    def match_rules(self, context: Dict[str, Any]) -> List[BusinessRule]:
+        """
+        Find the registered rules whose conditions are met by a context.
+        
+        Only rules indexed under one of the context's keys, plus rules with
+        no indexable field, are evaluated.
+        
+        Args:
+            context: Execution context to match against
+            
+        Returns:
+            Matching rules in registration order
+        """
+        candidates = list(self._unindexed_rules)
+        for key in context:
+            bucket = self._rules_by_field.get(key)
+            if bucket:
+                candidates.extend(bucket)
+                
+        rule_index = self._rule_index
+        candidates.sort(key=lambda rule: rule_index[rule.id][0])
+        return [rule for rule in candidates if rule.should_execute(context)]
+        
+    def match_rules_batch(self, contexts: List[Dict[str, Any]]) -> List[List[BusinessRule]]:
+        """
+        Match registered rules against many contexts at once.
+        
+        Rules are independent of each other, so each rule is evaluated
+        column-wise (see BusinessRule.evaluate_batch) over just the contexts
+        that contain its index field.
+        
+        Args:
+            contexts: Execution contexts to match against
+            
+        Returns:
+            For each context, the matching rules in registration order
+        """
+        matches: List[List[BusinessRule]] = [[] for _ in contexts]
+        
+        for rule in self.active_rules:
+            key_field = self._rule_index[rule.id][1]
+            if key_field is None:
+                indices = range(len(contexts))
+            else:
+                indices = [i for i, context in enumerate(contexts) if key_field in context]
+            if not indices:
+                continue
+                
+            mask = rule.evaluate_batch([contexts[i] for i in indices])
+            for i, matched in zip(indices, mask):
+                if matched:
+                    matches[i].append(rule)
+                    
+        return matches
+        
+    def clear_rules(self) -> None:
+        """Remove all active rules while keeping registered adapters."""
+        self.active_rules.clear()
+        self._rules_by_field.clear()
+        self._unindexed_rules.clear()
+        self._rule_index.clear()
+        
     async def execute_rule(self, rule: BusinessRule, context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute a business rule across applicable framework adapters.
@@ -57,26 +171,69 @@ class MetaOrchestrator:
         # Determine which adapters can handle this rule
         applicable_adapters = await self._get_applicable_adapters(rule, context)
         
-        # Execute rule on each applicable adapter
-        tasks = []
-        for adapter_name, adapter in applicable_adapters.items():
-            task = self._execute_on_adapter(adapter_name, adapter, rule, context)
-            tasks.append(task)
-            
-        # Wait for all executions to complete
-        adapter_results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Process results
-        for i, (adapter_name, _) in enumerate(applicable_adapters.items()):
-            result = adapter_results[i]
-            if isinstance(result, Exception):
-                logger.error(f"Adapter {adapter_name} failed: {result}")
-                results[adapter_name] = {"error": str(result)}
-            else:
-                results[adapter_name] = result
+        # Adapters whose actions are independent run concurrently; adapters
+        # whose actions depend on another adapter's actions run in a later wave
+        for layer in self._plan_adapter_layers(rule, list(applicable_adapters)):
+            tasks = []
+            for adapter_name in layer:
+                task = self._execute_on_adapter(
+                    adapter_name, applicable_adapters[adapter_name], rule, context
+                )
+                tasks.append(task)
                 
+            # Wait for all executions in this wave to complete
+            adapter_results = await asyncio.gather(*tasks, return_exceptions=True)
+            
+            # Process results; a cancelled adapter counts as failed rather
+            # than passing its CancelledError off as a result
+            for adapter_name, result in zip(layer, adapter_results):
+                if isinstance(result, BaseException):
+                    logger.error(f"Adapter {adapter_name} failed: {result!r}")
+                    results[adapter_name] = {"error": str(result) or type(result).__name__}
+                else:
+                    results[adapter_name] = result
+                    
         return results
         
+    def _plan_adapter_layers(self, rule: BusinessRule, adapter_names: List[str]) -> List[List[str]]:
+        """
+        Order adapters into waves based on action dependencies.
+        
+        An adapter waits for another when one of its actions lists an action
+        of the other adapter's framework in ``depends_on``.
+        
+        Args:
+            rule: The business rule being executed
+            adapter_names: Names of the adapters that will execute the rule
+            
+        Returns:
+            Lists of adapter names; each list can run concurrently
+        """
+        action_frameworks = {action.action: action.framework for action in rule.actions}
+        waits_on: Dict[str, set] = {name: set() for name in adapter_names}
+        
+        for action in rule.actions:
+            if action.framework not in waits_on:
+                continue
+            for dependency in action.depends_on:
+                framework = action_frameworks.get(dependency)
+                if framework in waits_on and framework != action.framework:
+                    waits_on[action.framework].add(framework)
+                    
+        layers = []
+        remaining = list(adapter_names)
+        done: set = set()
+        while remaining:
+            ready = [name for name in remaining if waits_on[name] <= done]
+            if not ready:
+                logger.warning(f"Circular action dependencies in rule {rule.name}, running remaining adapters together")
+                ready = remaining
+            layers.append(ready)
+            done.update(ready)
+            remaining = [name for name in remaining if name not in done]
+            
+        return layers
+        
     async def _get_applicable_adapters(
         self, rule: BusinessRule, context: Dict[str, Any]
     ) -> Dict[str, FrameworkAdapter]:
@@ -142,14 +299,20 @@ class MetaOrchestrator:
             "adapters": {}
         }
         
-        for name, adapter in self.adapters.items():
-            try:
-                adapter_health = await adapter.health_check()
-                health_status["adapters"][name] = adapter_health
-            except Exception as e:
+        # Check all adapters concurrently
+        adapter_health = await asyncio.gather(
+            *[adapter.health_check() for adapter in self.adapters.values()],
+            return_exceptions=True
+        )
+        
+        for name, result in zip(self.adapters, adapter_health):
+            # BaseException so a cancelled check is reported, not stored as its result
+            if isinstance(result, BaseException):
                 health_status["adapters"][name] = {
                     "status": "unhealthy",
-                    "error": str(e)
+                    "error": str(result) or type(result).__name__
                 }
+            else:
+                health_status["adapters"][name] = result
                 
         return health_status
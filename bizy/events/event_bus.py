@@ -5,15 +5,31 @@ This module provides an async event bus for coordinating communication
 between different framework adapters.
 """
 
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional
 import asyncio
 import logging
+from collections import deque
 from datetime import datetime
+from enum import Enum
+from itertools import islice
 import json
 
 logger = logging.getLogger(__name__)
 
 
+def _event_key(event_type: str) -> str:
+    """
+    Normalize an event type to the plain string used as subscriber key.
+    
+    ``EventType`` members hash by member name through a Python-level
+    ``Enum.__hash__``, so they neither match subscriptions made with the raw
+    string value nor hash at C speed. Keying on the value fixes both.
+    """
+    if isinstance(event_type, Enum):
+        return event_type.value
+    return event_type
+
+
 class Event:
     """Represents an event in the system."""
     
@@ -43,10 +59,61 @@ class EventBus:
     between framework adapters and the meta-orchestrator.
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        max_history_size: int = 1000,
+        redis_url: Optional[str] = None,
+        max_connections: int = 32
+    ):
+        """
+        Initialize the event bus.
+        
+        Args:
+            max_history_size: Number of recent events kept in memory
+            redis_url: Optional Redis URL; when set, connect() opens a
+                connection pool and published events are also sent to the
+                Redis channel named after the event type
+            max_connections: Size of the Redis connection pool
+        """
         self.subscribers: Dict[str, List[Callable]] = {}
-        self.event_history: List[Event] = []
-        self.max_history_size = 1000
+        self.optional_subscribers: Dict[str, List[Callable]] = {}
+        # Bounded ring: appending past capacity evicts the oldest event
+        self.event_history: Deque[Event] = deque(maxlen=max_history_size)
+        self.max_history_size = max_history_size
+        self._background_tasks = set()
+        self.redis_url = redis_url
+        self.max_connections = max_connections
+        self._redis = None
+        
+    async def connect(self) -> None:
+        """
+        Open the Redis connection pool, if a Redis URL was configured.
+        
+        The pool is created once and shared by every publish, so the hot
+        path never opens a new connection.
+        """
+        if not self.redis_url or self._redis is not None:
+            return
+            
+        import redis.asyncio as aioredis
+        
+        pool = aioredis.ConnectionPool.from_url(
+            self.redis_url,
+            max_connections=self.max_connections,
+            decode_responses=True
+        )
+        self._redis = aioredis.Redis(connection_pool=pool)
+        logger.info(f"Event bus connected to Redis at {self.redis_url}")
+        
+    async def disconnect(self) -> None:
+        """Close the Redis client and release its pooled connections."""
+        if self._redis is None:
+            return
+            
+        client, self._redis = self._redis, None
+        await client.aclose()
+        await client.connection_pool.disconnect()
+        logger.info("Event bus disconnected from Redis")
         
     async def publish(self, event_type: str, data: Dict[str, Any], source: Optional[str] = None) -> None:
         """
@@ -58,23 +125,41 @@ class EventBus:
             source: Optional source identifier
         """
         event = Event(event_type, data, source)
+        key = _event_key(event_type)
         
         # Add to history
         self.event_history.append(event)
-        if len(self.event_history) > self.max_history_size:
-            self.event_history.pop(0)
             
-        # Notify subscribers
-        if event_type in self.subscribers:
+        # Optional subscribers (logging, metrics) never hold up the publisher
+        for callback in self.optional_subscribers.get(key, ()):
+            self._dispatch_optional(callback, event)
+            
+        # Notify required subscribers; plain functions run inline and only
+        # coroutine callbacks are awaited together
+        callbacks = self.subscribers.get(key)
+        if callbacks:
             tasks = []
-            for callback in self.subscribers[event_type]:
-                task = asyncio.create_task(self._invoke_callback(callback, event))
-                tasks.append(task)
+            for callback in callbacks:
+                if asyncio.iscoroutinefunction(callback):
+                    tasks.append(self._invoke_callback(callback, event))
+                else:
+                    self._invoke_sync_callback(callback, event)
+                    
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
                 
-            await asyncio.gather(*tasks, return_exceptions=True)
+        if self._redis is not None:
+            await self._publish_to_redis(key, event)
             
         logger.debug(f"Published event: {event_type} from {source}")
         
+    async def _publish_to_redis(self, channel: str, event: Event) -> None:
+        """Forward an event to Redis over a pooled connection."""
+        try:
+            await self._redis.publish(channel, json.dumps(event.to_dict(), default=str))
+        except Exception as e:
+            logger.error(f"Failed to publish event to Redis: {e}")
+            
     async def _invoke_callback(self, callback: Callable, event: Event) -> None:
         """Invoke a subscriber callback with error handling."""
         try:
@@ -85,18 +170,39 @@ class EventBus:
         except Exception as e:
             logger.error(f"Error in event callback: {e}")
             
-    def subscribe(self, event_type: str, callback: Callable) -> None:
+    def _invoke_sync_callback(self, callback: Callable, event: Event) -> None:
+        """Invoke a plain function subscriber with error handling."""
+        try:
+            callback(event)
+        except Exception as e:
+            logger.error(f"Error in event callback: {e}")
+            
+    def _dispatch_optional(self, callback: Callable, event: Event) -> None:
+        """Schedule an optional subscriber without waiting for it."""
+        if asyncio.iscoroutinefunction(callback):
+            task = asyncio.create_task(self._invoke_callback(callback, event))
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+        else:
+            asyncio.get_running_loop().call_soon(self._invoke_sync_callback, callback, event)
+            
+    def subscribe(self, event_type: str, callback: Callable, required: bool = True) -> None:
         """
         Subscribe to events of a specific type.
         
         Args:
             event_type: Type of events to subscribe to
             callback: Function to call when event is published
+            required: Whether publish waits for this subscriber. Optional
+                subscribers (e.g. logging) are scheduled and never gate
+                the publisher.
         """
-        if event_type not in self.subscribers:
-            self.subscribers[event_type] = []
+        key = _event_key(event_type)
+        subscribers = self.subscribers if required else self.optional_subscribers
+        if key not in subscribers:
+            subscribers[key] = []
             
-        self.subscribers[event_type].append(callback)
+        subscribers[key].append(callback)
         logger.debug(f"Subscribed to event: {event_type}")
         
     def unsubscribe(self, event_type: str, callback: Callable) -> None:
@@ -107,11 +213,13 @@ class EventBus:
             event_type: Type of events to unsubscribe from
             callback: Callback function to remove
         """
-        if event_type in self.subscribers:
-            self.subscribers[event_type].remove(callback)
-            if not self.subscribers[event_type]:
-                del self.subscribers[event_type]
-                
+        key = _event_key(event_type)
+        for subscribers in (self.subscribers, self.optional_subscribers):
+            if key in subscribers and callback in subscribers[key]:
+                subscribers[key].remove(callback)
+                if not subscribers[key]:
+                    del subscribers[key]
+                    
         logger.debug(f"Unsubscribed from event: {event_type}")
         
     def get_event_history(self, event_type: Optional[str] = None, limit: int = 100) -> List[Event]:
@@ -120,17 +228,38 @@ class EventBus:
         
         Args:
             event_type: Optional event type filter
-            limit: Maximum number of events to return
+            limit: Maximum number of events to return; 0 returns all of them
             
         Returns:
-            List of events matching criteria
+            List of events matching criteria, oldest first
         """
-        history = self.event_history
+        key = _event_key(event_type) if event_type else None
         
-        if event_type:
-            history = [e for e in history if e.event_type == event_type]
+        if limit <= 0:
+            # Same result as slicing the full history with [-limit:]
+            history = [e for e in self.event_history if key is None or _event_key(e.event_type) == key]
+            return history[-limit:]
             
-        return history[-limit:]
+        # Walk back from the newest event so only the requested tail is visited
+        history = reversed(self.event_history)
+        
+        if key is not None:
+            history = (e for e in history if _event_key(e.event_type) == key)
+            
+        recent = list(islice(history, limit))
+        recent.reverse()
+        return recent
+        
+    def reset(self) -> None:
+        """
+        Remove all subscribers and clear event history.
+        
+        Containers are cleared in place so a long-lived bus can be reused,
+        e.g. between test scenarios.
+        """
+        self.subscribers.clear()
+        self.optional_subscribers.clear()
+        self.event_history.clear()
         
     def clear_history(self) -> None:
         """Clear event history."""
@@ -332,6 +332,8 @@ class RuleParser:
                 action.timeout = action_data["timeout"]
             if "retry_count" in action_data:
                 action.retry_count = action_data["retry_count"]
+            if "depends_on" in action_data:
+                action.depends_on = list(action_data["depends_on"])
             if "continue_on_error" in action_data:
                 action.continue_on_error = action_data["continue_on_error"]
             if "description" in action_data:
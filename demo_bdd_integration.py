@@ -8,77 +8,222 @@ rule definition and execution.
 """
 
 import asyncio
-import json
+from itertools import islice
+import os
 from pathlib import Path
 import sys
 import logging
 
-# Add project root to path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+# Add project root to path when run as a plain script; prefer
+# `python -m demo_bdd_integration` from the project root
+if __name__ == "__main__" and __package__ is None:
+    project_root = os.path.dirname(os.path.abspath(__file__))
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
 
 from business_logic_orchestrator.core.meta_orchestrator import MetaOrchestrator
 from business_logic_orchestrator.core.business_rule import (
     BusinessRule, RuleCondition, RuleAction, RuleType, RulePriority
 )
 from business_logic_orchestrator.bdd import (
-    GherkinRuleParser, BDDScenarioExecutor, BDDDocumentationGenerator
+    GherkinRuleParser, BDDScenarioExecutor, BDDDocumentationGenerator,
+    parse_feature_files_parallel
 )
 from business_logic_orchestrator.bdd.gherkin_parser import ScenarioTemplateGenerator
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Shared rule fixtures, built once and reused across the demos below
+_PREMIUM_ESCALATION_RULE = BusinessRule(
+    name="Premium customer escalation workflow",
+    rule_type=RuleType.WORKFLOW,
+    priority=RulePriority.HIGH,
+    conditions=[
+        RuleCondition("customer.tier", "eq", "premium"),
+        RuleCondition("sentiment_score", "lt", 0.3),
+        RuleCondition("customer.account_value", "gt", 10000)
+    ],
+    actions=[
+        RuleAction("langchain", "analyze_sentiment", {"analysis_type": "detailed"}),
+        RuleAction("temporal", "start_escalation_workflow", {"priority": "high"}),
+        RuleAction("mcp", "notify_account_manager", {"urgency": "immediate"}),
+        RuleAction("zep", "update_customer_context", {"interaction_type": "escalation"})
+    ],
+    description="Escalate premium customers with negative sentiment and high account value"
+)
+
+_SUPPORT_ESCALATION_RULE = BusinessRule(
+    name="Premium customer support escalation",
+    conditions=[
+        RuleCondition("customer.tier", "eq", "premium"),
+        RuleCondition("customer.sentiment_score", "lt", 0.3)
+    ],
+    actions=[
+        RuleAction("langchain", "analyze_sentiment", {"deep_analysis": True}),
+        RuleAction("temporal", "start_escalation_workflow", {"priority": "urgent"}),
+        RuleAction("mcp", "notify_account_manager", {"method": "immediate"})
+    ]
+)
+
+_LARGE_DATASET_RULE = BusinessRule(
+    name="Large dataset processing",
+    rule_type=RuleType.ACTION,
+    priority=RulePriority.MEDIUM,
+    conditions=[
+        RuleCondition("data_size", "gt", 1000),
+        RuleCondition("processing_required", "eq", True)
+    ],
+    actions=[
+        RuleAction("fastmcp", "batch_process", {}),
+        RuleAction("zep", "store_context", {})
+    ]
+)
+
+_DOC_EXTRACTION_RULE = BusinessRule(
+    name="Document knowledge extraction",
+    rule_type=RuleType.POLICY,
+    priority=RulePriority.LOW,
+    conditions=[
+        RuleCondition("document_type", "eq", "legal"),
+        RuleCondition("extract_knowledge", "eq", True)
+    ],
+    actions=[
+        RuleAction("langchain", "extract_entities", {}),
+        RuleAction("semantic_kernel", "analyze_content", {})
+    ]
+)
+
+
+# Static output of the community contribution demo
+_COMMUNITY_OUTPUT = """\n🌐 Demo: Community Contribution Patterns
+============================================================
+🎯 Value for Behave Community:
+   • Natural language AI system testing
+   • Business stakeholder involvement in test creation
+   • Cross-framework coordination testing patterns
+   • Living documentation that stays current
+
+🎯 Value for Cucumber Community:
+   • AI testing patterns across multiple languages
+   • Enterprise business process automation testing
+   • Framework-agnostic business logic patterns
+   • Real-world complex system coordination examples
+
+🎯 Value for AI Framework Communities:
+   • Standardized testing approaches for framework integration
+   • Business-friendly validation of AI system behavior
+   • Cross-framework coordination best practices
+   • Reduced barrier to entry for business stakeholders
+
+📦 Example Community Contribution Packages:
+
+behave-ai-orchestration/
+  setup.py
+  behave_ai_orchestration/
+    __init__.py
+    steps/
+      ai_frameworks.py
+      business_logic.py
+      coordination.py
+    templates/
+      customer_service.feature
+      document_processing.feature
+    examples/
+      README.md
+
+cucumber-ai-patterns/
+  package.json
+  features/
+    step_definitions/
+      ai_frameworks.js
+      business_logic.js
+  support/
+    world.js
+  templates/
+    enterprise_workflows.feature
+
+✨ Innovation Highlights:
+   🆕 First business-stakeholder-accessible AI testing
+   🆕 First comprehensive cross-framework BDD integration
+   🆕 First executable business process documentation for AI
+   🆕 First community ecosystem for AI business logic patterns
+"""
+
+
+class _Out:
+    """Collects demo output and writes it to stdout in one call on exit."""
+    
+    def __init__(self):
+        self.buf = []
+        
+    def __enter__(self):
+        return self
+        
+    def __exit__(self, *exc_info):
+        # Flush even when the demo raises so partial output is not lost
+        self.flush()
+        
+    def p(self, s=''):
+        self.buf.append(s)
+        
+    def flush(self):
+        sys.stdout.write('\n'.join(self.buf))
+        sys.stdout.write('\n')
+        self.buf.clear()
+
+
+def iter_lines(s: str):
+    """Yield the lines of ``s`` one at a time without building a list."""
+    start = 0
+    while True:
+        idx = s.find('\n', start)
+        if idx < 0:
+            yield s[start:]
+            return
+        yield s[start:idx]
+        start = idx + 1
+
+
+def head_lines(s: str, n: int) -> list[str]:
+    """Return the first ``n`` lines of ``s`` without splitting the whole string."""
+    return list(islice(iter_lines(s), n))
+
+
 async def demo_existing_rule_to_gherkin():
     """Demonstrate converting existing BusinessRule objects to natural language."""
-    print("🔄 Demo: Converting Existing Business Rules to BDD Scenarios")
-    print("=" * 60)
-    
-    # Use the existing customer escalation rule from the demo
-    rule = BusinessRule(
-        name="Premium customer escalation workflow",
-        rule_type=RuleType.WORKFLOW,
-        priority=RulePriority.HIGH,
-        conditions=[
-            RuleCondition("customer.tier", "eq", "premium"),
-            RuleCondition("sentiment_score", "lt", 0.3),
-            RuleCondition("customer.account_value", "gt", 10000)
-        ],
-        actions=[
-            RuleAction("langchain", "analyze_sentiment", {"analysis_type": "detailed"}),
-            RuleAction("temporal", "start_escalation_workflow", {"priority": "high"}),
-            RuleAction("mcp", "notify_account_manager", {"urgency": "immediate"}),
-            RuleAction("zep", "update_customer_context", {"interaction_type": "escalation"})
-        ],
-        description="Escalate premium customers with negative sentiment and high account value"
-    )
-    
-    # Convert to natural language BDD scenario
-    generator = BDDDocumentationGenerator()
-    scenario_text = generator.generate_scenario(rule)
-    
-    print("✅ Existing BusinessRule converted to BDD scenario:")
-    print(scenario_text)
-    print()
-    
-    # Generate business stakeholder summary
-    stakeholder_summary = generator.generate_stakeholder_summary([rule])
-    print("📊 Business Stakeholder Summary:")
-    print("=" * 40)
-    print(stakeholder_summary[:500] + "...")  # Show first 500 chars
-    
+    with _Out() as out:
+        out.p("🔄 Demo: Converting Existing Business Rules to BDD Scenarios")
+        out.p("=" * 60)
+        
+        # Use the existing customer escalation rule from the demo
+        rule = _PREMIUM_ESCALATION_RULE
+        
+        # Convert to natural language BDD scenario
+        generator = BDDDocumentationGenerator()
+        scenario_text = generator.generate_scenario(rule)
+        
+        out.p("✅ Existing BusinessRule converted to BDD scenario:")
+        out.p(scenario_text)
+        out.p()
+        
+        # Generate business stakeholder summary
+        stakeholder_summary = generator.generate_stakeholder_summary([rule])
+        out.p("📊 Business Stakeholder Summary:")
+        out.p("=" * 40)
+        out.p(stakeholder_summary[:500] + "...")  # Show first 500 chars
+        
     return rule, scenario_text
 
 
 async def demo_gherkin_to_rule_conversion():
     """Demonstrate converting natural language scenarios to BusinessRule objects."""
-    print("\n🎭 Demo: Converting Natural Language to Executable Rules")
-    print("=" * 60)
-    
-    # Create a natural language scenario
-    scenario_text = '''
+    with _Out() as out:
+        out.p("\n🎭 Demo: Converting Natural Language to Executable Rules")
+        out.p("=" * 60)
+        
+        # Create a natural language scenario
+        scenario_text = '''
 Scenario: High-value customer data processing workflow
     Given a customer with tier "enterprise"
     And the customer account value is above 100000
@@ -90,297 +235,222 @@ Scenario: High-value customer data processing workflow
     And batch process data via FastMCP
     And store analysis context in Zep memory
     '''
-    
-    print("📝 Natural Language Scenario:")
-    print(scenario_text)
-    
-    # Parse into BusinessRule
-    parser = GherkinRuleParser()
-    rule = parser.parse_scenario_text(scenario_text)
-    
-    if rule:
-        print("\n✅ Converted to BusinessRule:")
-        print(f"   Name: {rule.name}")
-        print(f"   Type: {rule.rule_type.value}")
-        print(f"   Priority: {rule.priority.name}")
-        print(f"   Conditions: {len(rule.conditions)}")
-        for condition in rule.conditions:
-            print(f"     - {condition.field} {condition.operator} {condition.value}")
-        print(f"   Actions: {len(rule.actions)}")
-        for action in rule.actions:
-            print(f"     - {action.framework}: {action.action}")
-    else:
-        print("❌ Failed to parse scenario")
         
+        out.p("📝 Natural Language Scenario:")
+        out.p(scenario_text)
+        
+        # Parse into BusinessRule
+        parser = GherkinRuleParser()
+        rule = parser.parse_scenario_text(scenario_text)
+        
+        if rule:
+            out.p("\n✅ Converted to BusinessRule:")
+            out.p(f"   Name: {rule.name}")
+            out.p(f"   Type: {rule.rule_type.value}")
+            out.p(f"   Priority: {rule.priority.name}")
+            out.p(f"   Conditions: {len(rule.conditions)}")
+            for condition in rule.conditions:
+                out.p(f"     - {condition.field} {condition.operator} {condition.value}")
+            out.p(f"   Actions: {len(rule.actions)}")
+            for action in rule.actions:
+                out.p(f"     - {action.framework}: {action.action}")
+        else:
+            out.p("❌ Failed to parse scenario")
+            
     return rule
 
 
 async def demo_bdd_execution_with_orchestrator():
     """Demonstrate executing BDD scenarios through the existing orchestrator."""
-    print("\n⚡ Demo: Executing BDD Scenarios with Orchestrator")
-    print("=" * 60)
-    
-    # Create orchestrator (same as existing demo)
-    orchestrator = MetaOrchestrator()
-    bdd_executor = BDDScenarioExecutor(orchestrator)
-    
-    # Create a sample business context
-    context = {
-        "customer": {
-            "tier": "premium",
-            "account_value": 75000,
-            "sentiment_score": 0.25
-        },
-        "interaction": {
-            "type": "support_ticket",
-            "category": "billing",
-            "priority": "urgent"
+    with _Out() as out:
+        out.p("\n⚡ Demo: Executing BDD Scenarios with Orchestrator")
+        out.p("=" * 60)
+        
+        # Create orchestrator (same as existing demo)
+        orchestrator = MetaOrchestrator()
+        bdd_executor = BDDScenarioExecutor(orchestrator)
+        
+        # Create a sample business context
+        context = {
+            "customer": {
+                "tier": "premium",
+                "account_value": 75000,
+                "sentiment_score": 0.25
+            },
+            "interaction": {
+                "type": "support_ticket",
+                "category": "billing",
+                "priority": "urgent"
+            }
         }
-    }
-    
-    # Create a rule that matches our context
-    rule = BusinessRule(
-        name="Premium customer support escalation",
-        conditions=[
-            RuleCondition("customer.tier", "eq", "premium"),
-            RuleCondition("customer.sentiment_score", "lt", 0.3)
-        ],
-        actions=[
-            RuleAction("langchain", "analyze_sentiment", {"deep_analysis": True}),
-            RuleAction("temporal", "start_escalation_workflow", {"priority": "urgent"}),
-            RuleAction("mcp", "notify_account_manager", {"method": "immediate"})
-        ]
-    )
-    
-    print(f"📋 Executing rule: {rule.name}")
-    print(f"📊 Context: Customer tier={context['customer']['tier']}, Sentiment={context['customer']['sentiment_score']}")
-    
-    # Execute through BDD executor
-    result = await bdd_executor.execute_business_rule(rule, context)
-    
-    print(f"\n🎯 Execution Result:")
-    print(f"   Success: {result.get('success', False)}")
-    print(f"   Skipped: {result.get('skipped', False)}")
-    if result.get('skipped'):
-        print(f"   Reason: {result.get('reason', 'Unknown')}")
-    else:
-        print(f"   Conditions Evaluated: {result.get('conditions_evaluated', 0)}")
-        print(f"   Actions Executed: {result.get('actions_executed', 0)}")
-        print(f"   Frameworks Involved: {result.get('frameworks_involved', [])}")
-    
+        
+        # Use a rule that matches our context
+        rule = _SUPPORT_ESCALATION_RULE
+        
+        out.p(f"📋 Executing rule: {rule.name}")
+        out.p(f"📊 Context: Customer tier={context['customer']['tier']}, Sentiment={context['customer']['sentiment_score']}")
+        
+        # Execute through BDD executor
+        batch_result = await bdd_executor.execute_business_rules_batch([rule], context)
+        result = batch_result['details'][0]['result']
+        
+        success = result.get('success', False)
+        skipped = result.get('skipped', False)
+        out.p(
+            f"\n🎯 Execution Result:\n"
+            f"   Success: {success}\n"
+            f"   Skipped: {skipped}"
+        )
+        if skipped:
+            reason = result.get('reason', 'Unknown')
+            out.p(f"   Reason: {reason}")
+        else:
+            cond_n = result.get('conditions_evaluated', 0)
+            act_n = result.get('actions_executed', 0)
+            frameworks = result.get('frameworks_involved', [])
+            out.p(
+                f"   Conditions Evaluated: {cond_n}\n"
+                f"   Actions Executed: {act_n}\n"
+                f"   Frameworks Involved: {frameworks}"
+            )
+        
+        # Evaluate several rules against the same context in a single batch
+        rules = [rule, _PREMIUM_ESCALATION_RULE, _LARGE_DATASET_RULE]
+        batch_result = await bdd_executor.execute_business_rules_batch(rules, context)
+        
+        out.p(f"\n📦 Batch Execution of {len(rules)} Rules:")
+        out.p(f"   Passed: {batch_result['scenarios_passed']}")
+        out.p(f"   Skipped: {batch_result['scenarios_skipped']}")
+        out.p(f"   Failed: {batch_result['scenarios_failed']}")
+        out.p(f"   Total Time: {batch_result['total_execution_time']:.3f}s")
+        
+        # Filter many records against one rule column by column
+        records = [context] * 1000
+        matches = sum(rule.evaluate_batch(records))
+        out.p(f"\n🔎 Mass Record Filtering: {matches}/{len(records)} records match '{rule.name}'")
+        
     return result
 
 
 async def demo_business_process_templates():
     """Demonstrate business process templates for stakeholders."""
-    print("\n📋 Demo: Business Process Templates")
-    print("=" * 60)
-    
-    # Generate templates for common business scenarios
-    templates = {
-        "Customer Service": ScenarioTemplateGenerator.generate_customer_service_template(),
-        "Document Processing": ScenarioTemplateGenerator.generate_document_processing_template(),
-        "Data Pipeline": ScenarioTemplateGenerator.generate_data_pipeline_template()
-    }
-    
-    for template_name, template_content in templates.items():
-        print(f"\n📄 {template_name} Template:")
-        print("-" * 40)
-        # Show first few lines of each template
-        lines = template_content.split('\n')[:8]
-        for line in lines:
-            print(line)
-        print("    ...")
-        
-    print(f"\n✅ Generated {len(templates)} business process templates")
-    print("💡 Stakeholders can customize these templates for their specific needs")
-    
+    with _Out() as out:
+        out.p("\n📋 Demo: Business Process Templates")
+        out.p("=" * 60)
+        
+        # Generate templates for common business scenarios
+        templates = {
+            "Customer Service": ScenarioTemplateGenerator.generate_customer_service_template(),
+            "Document Processing": ScenarioTemplateGenerator.generate_document_processing_template(),
+            "Data Pipeline": ScenarioTemplateGenerator.generate_data_pipeline_template()
+        }
+        
+        for template_name, template_content in templates.items():
+            out.p(f"\n📄 {template_name} Template:")
+            out.p("-" * 40)
+            # Show first few lines of each template
+            lines = head_lines(template_content, 8)
+            for line in lines:
+                out.p(line)
+            out.p("    ...")
+            
+        out.p(f"\n✅ Generated {len(templates)} business process templates")
+        out.p("💡 Stakeholders can customize these templates for their specific needs")
+        
     return templates
 
 
 async def demo_feature_file_execution():
     """Demonstrate executing a complete feature file."""
-    print("\n📁 Demo: Feature File Execution")
-    print("=" * 60)
-    
-    # Check if feature file exists
-    feature_file = Path("features/cross_framework_orchestration.feature")
-    
-    if feature_file.exists():
-        print(f"📂 Found feature file: {feature_file.name}")
+    with _Out() as out:
+        out.p("\n📁 Demo: Feature File Execution")
+        out.p("=" * 60)
         
-        # Parse the feature file
-        parser = GherkinRuleParser()
-        try:
-            rules = parser.parse_feature_file(feature_file)
-            print(f"✅ Parsed {len(rules)} business rules from feature file")
+        # Check if feature file exists
+        feature_file = Path("features/cross_framework_orchestration.feature")
+        
+        if feature_file.exists():
+            out.p(f"📂 Found feature file: {feature_file.name}")
             
-            for i, rule in enumerate(rules[:3], 1):  # Show first 3 rules
-                print(f"   {i}. {rule.name}")
-                print(f"      - {len(rule.conditions)} conditions")
-                print(f"      - {len(rule.actions)} actions")
-                print(f"      - Priority: {rule.priority.name}")
+            # Stream the feature file; only the first three rules are materialized
+            parser = GherkinRuleParser()
+            try:
+                scenarios = parser.iter_scenarios(feature_file)
+                preview = list(islice(scenarios, 3))
+                rule_count = len(preview) + sum(1 for _ in scenarios)
+                out.p(f"✅ Parsed {rule_count} business rules from feature file")
                 
-        except Exception as e:
-            print(f"❌ Error parsing feature file: {e}")
-            rules = []
-    else:
-        print(f"📂 Feature file not found: {feature_file}")
-        print("💡 Run this demo from the project root directory")
-        rules = []
-        
-    return rules
+                for i, rule in enumerate(preview, 1):  # Show first 3 rules
+                    cond_n = len(rule.conditions)
+                    act_n = len(rule.actions)
+                    out.p(
+                        f"   {i}. {rule.name}\n"
+                        f"      - {cond_n} conditions\n"
+                        f"      - {act_n} actions\n"
+                        f"      - Priority: {rule.priority.name}"
+                    )
+                    
+            except Exception as e:
+                out.p(f"❌ Error parsing feature file: {e}")
+                rule_count = 0
+        else:
+            out.p(f"📂 Feature file not found: {feature_file}")
+            out.p("💡 Run this demo from the project root directory")
+            rule_count = 0
+            
+        # With several feature files, spread parsing across worker processes
+        feature_paths = sorted(feature_file.parent.glob("*.feature"))
+        if len(feature_paths) > 1:
+            rules_per_file = await asyncio.to_thread(parse_feature_files_parallel, feature_paths)
+            total_rules = sum(len(file_rules) for file_rules in rules_per_file)
+            out.p(f"⚡ Parsed {len(feature_paths)} feature files in parallel: {total_rules} rules")
+            
+    return rule_count
 
 
 async def demo_living_documentation():
     """Demonstrate generating living documentation from business rules."""
-    print("\n📚 Demo: Living Documentation Generation")
-    print("=" * 60)
-    
-    # Create a set of business rules representing different scenarios
-    rules = [
-        BusinessRule(
-            name="Premium customer escalation",
-            rule_type=RuleType.WORKFLOW,
-            priority=RulePriority.HIGH,
-            conditions=[
-                RuleCondition("customer.tier", "eq", "premium"),
-                RuleCondition("sentiment_score", "lt", 0.3)
-            ],
-            actions=[
-                RuleAction("temporal", "start_escalation_workflow", {}),
-                RuleAction("mcp", "notify_account_manager", {})
-            ]
-        ),
-        BusinessRule(
-            name="Large dataset processing",
-            rule_type=RuleType.ACTION,
-            priority=RulePriority.MEDIUM,
-            conditions=[
-                RuleCondition("data_size", "gt", 1000),
-                RuleCondition("processing_required", "eq", True)
-            ],
-            actions=[
-                RuleAction("fastmcp", "batch_process", {}),
-                RuleAction("zep", "store_context", {})
-            ]
-        ),
-        BusinessRule(
-            name="Document knowledge extraction",
-            rule_type=RuleType.POLICY,
-            priority=RulePriority.LOW,
-            conditions=[
-                RuleCondition("document_type", "eq", "legal"),
-                RuleCondition("extract_knowledge", "eq", True)
-            ],
-            actions=[
-                RuleAction("langchain", "extract_entities", {}),
-                RuleAction("semantic_kernel", "analyze_content", {})
-            ]
+    with _Out() as out:
+        out.p("\n📚 Demo: Living Documentation Generation")
+        out.p("=" * 60)
+        
+        # Business rules representing different scenarios
+        rules = [_PREMIUM_ESCALATION_RULE, _LARGE_DATASET_RULE, _DOC_EXTRACTION_RULE]
+        
+        # Generate documentation
+        generator = BDDDocumentationGenerator()
+        
+        # Process documentation, stakeholder summary and feature file share the
+        # per-rule phrases, so build them in one pass off the event loop
+        documentation = await asyncio.to_thread(
+            generator.generate_all,
+            rules,
+            "AI Business Logic Automation",
+            "AI Business Process Automation",
+            "Automated business logic that coordinates AI systems for enterprise workflows"
         )
-    ]
-    
-    # Generate documentation
-    generator = BDDDocumentationGenerator()
-    
-    # Business process documentation
-    process_doc = generator.generate_business_process_documentation(
-        rules, 
-        "AI Business Logic Automation"
-    )
-    
-    # Stakeholder summary
-    stakeholder_summary = generator.generate_stakeholder_summary(rules)
-    
-    # Feature file
-    feature_file = generator.generate_feature_file(
-        rules,
-        "AI Business Process Automation",
-        "Automated business logic that coordinates AI systems for enterprise workflows"
-    )
-    
-    print("📄 Generated Documentation Types:")
-    print(f"   1. Business Process Documentation ({len(process_doc)} characters)")
-    print(f"   2. Stakeholder Summary ({len(stakeholder_summary)} characters)")
-    print(f"   3. Feature File ({len(feature_file)} characters)")
-    
-    print("\n📋 Sample Feature File Content:")
-    print("-" * 40)
-    feature_lines = feature_file.split('\n')[:15]
-    for line in feature_lines:
-        print(line)
-    print("    ...")
-    
-    return {
-        'process_doc': process_doc,
-        'stakeholder_summary': stakeholder_summary,
-        'feature_file': feature_file
-    }
+        process_doc = documentation['process_doc']
+        stakeholder_summary = documentation['stakeholder_summary']
+        feature_file = documentation['feature_file']
+        
+        out.p("📄 Generated Documentation Types:")
+        out.p(f"   1. Business Process Documentation ({len(process_doc)} characters)")
+        out.p(f"   2. Stakeholder Summary ({len(stakeholder_summary)} characters)")
+        out.p(f"   3. Feature File ({len(feature_file)} characters)")
+        
+        out.p("\n📋 Sample Feature File Content:")
+        out.p("-" * 40)
+        feature_lines = head_lines(feature_file, 15)
+        for line in feature_lines:
+            out.p(line)
+        out.p("    ...")
+        
+    return documentation
 
 
 async def demo_community_contribution_example():
     """Demonstrate how this creates shareable patterns for the community."""
-    print("\n🌐 Demo: Community Contribution Patterns")
-    print("=" * 60)
-    
-    print("🎯 Value for Behave Community:")
-    print("   • Natural language AI system testing")
-    print("   • Business stakeholder involvement in test creation")
-    print("   • Cross-framework coordination testing patterns")
-    print("   • Living documentation that stays current")
-    
-    print("\n🎯 Value for Cucumber Community:")
-    print("   • AI testing patterns across multiple languages")
-    print("   • Enterprise business process automation testing")
-    print("   • Framework-agnostic business logic patterns")
-    print("   • Real-world complex system coordination examples")
-    
-    print("\n🎯 Value for AI Framework Communities:")
-    print("   • Standardized testing approaches for framework integration")
-    print("   • Business-friendly validation of AI system behavior")
-    print("   • Cross-framework coordination best practices")
-    print("   • Reduced barrier to entry for business stakeholders")
-    
-    # Create example contribution package structure
-    contribution_structure = {
-        "behave-ai-orchestration": [
-            "setup.py",
-            "behave_ai_orchestration/",
-            "  __init__.py",
-            "  steps/",
-            "    ai_frameworks.py",
-            "    business_logic.py",
-            "    coordination.py",
-            "  templates/",
-            "    customer_service.feature",
-            "    document_processing.feature",
-            "  examples/",
-            "    README.md"
-        ],
-        "cucumber-ai-patterns": [
-            "package.json",
-            "features/",
-            "  step_definitions/",
-            "    ai_frameworks.js",
-            "    business_logic.js",
-            "support/",
-            "  world.js",
-            "templates/",
-            "  enterprise_workflows.feature"
-        ]
-    }
-    
-    print("\n📦 Example Community Contribution Packages:")
-    for package_name, structure in contribution_structure.items():
-        print(f"\n{package_name}/")
-        for item in structure:
-            print(f"  {item}")
-    
-    print("\n✨ Innovation Highlights:")
-    print("   🆕 First business-stakeholder-accessible AI testing")
-    print("   🆕 First comprehensive cross-framework BDD integration")
-    print("   🆕 First executable business process documentation for AI")
-    print("   🆕 First community ecosystem for AI business logic patterns")
+    sys.stdout.write(_COMMUNITY_OUTPUT)
 
 
 async def main():
@@ -396,7 +466,7 @@ async def main():
         new_rule = await demo_gherkin_to_rule_conversion()
         execution_result = await demo_bdd_execution_with_orchestrator()
         templates = await demo_business_process_templates()
-        feature_rules = await demo_feature_file_execution()
+        feature_rule_count = await demo_feature_file_execution()
         documentation = await demo_living_documentation()
         await demo_community_contribution_example()
         
@@ -407,7 +477,7 @@ async def main():
         print(f"   ✅ Natural language → Rule parsing: {'Success' if new_rule else 'Failed'}")
         print(f"   ✅ BDD scenario execution: {'Success' if execution_result.get('success') else 'Failed'}")
         print(f"   ✅ Business process templates: {len(templates)} generated")
-        print(f"   ✅ Feature file parsing: {len(feature_rules)} rules extracted")
+        print(f"   ✅ Feature file parsing: {feature_rule_count} rules extracted")
         print(f"   ✅ Living documentation: {len(documentation)} formats generated")
         
         print("\n🎯 Key Achievements:")
@@ -437,4 +507,6 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Configure logging only when run as a script, not when imported for fixtures
+    logging.basicConfig(level=logging.INFO)
     asyncio.run(main())
@@ -9,6 +9,8 @@ This example shows how to:
 """
 
 import asyncio
+import copy
+import functools
 import logging
 from pathlib import Path
 
@@ -19,9 +21,71 @@ from business_logic_orchestrator.core import MetaOrchestrator
 from business_logic_orchestrator.events import EventBus
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger(__name__)
 
+SEPARATOR = "=" * 60
+
+
+SAMPLE_CONTEXT = {
+    "customer_id": "CUST-12345",
+    "customer_tier": "premium",
+    "sentiment_score": 0.25,  # Negative sentiment
+    "interaction_count": 3,
+    "customer_context": {
+        "name": "John Doe",
+        "account_value": 50000,
+        "tenure_years": 5
+    }
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_cached(path_str, mtime_ns, size):
+    """Parse a rule file; keyed on its stat so edits invalidate the entry."""
+    return RuleParser().parse_file(Path(path_str))
+
+
+def parse_rule_file(path):
+    """
+    Parse a YAML rule file, reusing the previous result if it is unchanged.
+    
+    Callers get a deep copy, so modifying the returned rule (including its
+    condition and action lists) never leaks into the cached instance.
+    """
+    stat = Path(path).stat()
+    return copy.deepcopy(_parse_cached(str(path), stat.st_mtime_ns, stat.st_size))
+
+
+async def process_rule(rule_path, validator, compiler, executor):
+    """
+    Parse, validate, compile and (optionally) execute a single rule file.
+    
+    Parse and execution failures are returned in place of the parsed rule
+    and execution result respectively, so one bad file never cancels the
+    rest of the batch.
+    
+    Returns:
+        Tuple of (rule, validation_result, compilation_result, exec_result)
+    """
+    try:
+        rule = await asyncio.to_thread(parse_rule_file, rule_path)
+    except Exception as e:
+        return e, None, None, None
+        
+    validation_result = validator.validate(rule)
+    compilation_result = compiler.compile(rule, optimization_level=2)
+    
+    exec_result = None
+    if rule.id == "customer_escalation":
+        try:
+            # Note: This would actually execute if adapters were connected
+            exec_result = await executor.execute(rule, SAMPLE_CONTEXT)
+        except Exception as e:
+            exec_result = e
+            
+    return rule, validation_result, compilation_result, exec_result
+
 
 async def main():
     """Demonstrate rule parsing, validation, compilation, and execution."""
@@ -44,105 +108,95 @@ async def main():
         "inventory_optimization.yaml"
     ]
     
-    for rule_file in rule_files:
-        logger.info(f"\n{'='*60}")
-        logger.info(f"Processing rule: {rule_file}")
-        logger.info(f"{'='*60}")
+    # Process all rule files concurrently, then report in a stable order
+    async with asyncio.TaskGroup() as tg:
+        tasks = [
+            tg.create_task(
+                process_rule(rules_dir / f, validator, compiler, executor)
+            )
+            for f in rule_files
+        ]
         
-        # Parse rule
-        try:
-            rule = parser.parse_file(rules_dir / rule_file)
-            logger.info(f"✓ Successfully parsed rule: {rule.name}")
-            logger.info(f"  - ID: {rule.id}")
-            logger.info(f"  - Priority: {rule.priority}")
-            logger.info(f"  - Conditions: {len(rule.conditions)}")
-            logger.info(f"  - Actions: {len(rule.actions)}")
-            
-        except Exception as e:
-            logger.error(f"✗ Failed to parse rule: {e}")
+    for rule_file, task in zip(rule_files, tasks):
+        parsed, validation_result, compilation_result, exec_result = task.result()
+        
+        logger.info("\n%s", SEPARATOR)
+        logger.info("Processing rule: %s", rule_file)
+        logger.info(SEPARATOR)
+        
+        if isinstance(parsed, Exception):
+            logger.error("FAIL Failed to parse rule: %s", parsed)
             continue
             
-        # Validate rule
-        validation_result = validator.validate(rule)
+        rule = parsed
+        logger.info("OK Successfully parsed rule: %s", rule.name)
+        logger.info("  - ID: %s", rule.id)
+        logger.info("  - Priority: %s", rule.priority)
+        logger.info("  - Conditions: %d", len(rule.conditions))
+        logger.info("  - Actions: %d", len(rule.actions))
         
+        # Validation results
         if validation_result.valid:
-            logger.info("✓ Rule validation passed")
+            logger.info("OK Rule validation passed")
         else:
-            logger.error("✗ Rule validation failed:")
+            logger.error("FAIL Rule validation failed:")
             for error in validation_result.errors:
-                logger.error(f"  - {error}")
+                logger.error("  - %s", error)
                 
         if validation_result.warnings:
-            logger.warning("⚠ Validation warnings:")
+            logger.warning("WARN Validation warnings:")
             for warning in validation_result.warnings:
-                logger.warning(f"  - {warning}")
+                logger.warning("  - %s", warning)
                 
         if validation_result.suggestions:
-            logger.info("💡 Suggestions:")
+            logger.info("HINT Suggestions:")
             for suggestion in validation_result.suggestions:
-                logger.info(f"  - {suggestion}")
+                logger.info("  - %s", suggestion)
                 
-        # Compile rule
-        compilation_result = compiler.compile(rule, optimization_level=2)
-        
+        # Compilation results
         if compilation_result.success:
-            logger.info("✓ Rule compilation successful")
+            logger.info("OK Rule compilation successful")
             compiled_rule = compilation_result.compiled_rule
             
             # Show execution plan
-            logger.info("📋 Execution plan:")
+            logger.info("PLAN Execution plan:")
             for i, stage in enumerate(compiled_rule.execution_plan):
                 actions = [a.action for a in stage]
-                logger.info(f"  Stage {i+1}: {', '.join(actions)} (parallel)")
+                logger.info("  Stage %d: %s (parallel)", i + 1, ', '.join(actions))
                 
             # Show optimization stats
             if compilation_result.optimization_stats:
-                logger.info("📊 Optimization statistics:")
+                logger.info("STATS Optimization statistics:")
                 for key, value in compilation_result.optimization_stats.items():
-                    logger.info(f"  - {key}: {value}")
+                    logger.info("  - %s: %s", key, value)
                     
         else:
-            logger.error("✗ Rule compilation failed:")
+            logger.error("FAIL Rule compilation failed:")
             for error in compilation_result.errors:
-                logger.error(f"  - {error}")
+                logger.error("  - %s", error)
                 
-        # Example: Execute rule with sample context
+        # Example: Execution results for the customer escalation rule
         if rule.id == "customer_escalation":
-            logger.info("\n🚀 Executing customer escalation rule with sample data...")
+            logger.info("\nRUN Executing customer escalation rule with sample data...")
             
-            sample_context = {
-                "customer_id": "CUST-12345",
-                "customer_tier": "premium",
-                "sentiment_score": 0.25,  # Negative sentiment
-                "interaction_count": 3,
-                "customer_context": {
-                    "name": "John Doe",
-                    "account_value": 50000,
-                    "tenure_years": 5
-                }
-            }
-            
-            try:
-                # Note: This would actually execute if adapters were connected
-                result = await executor.execute(rule, sample_context)
-                
-                logger.info(f"✓ Execution completed: {'Success' if result.success else 'Failed'}")
-                logger.info(f"  - Duration: {result.duration:.2f}s")
-                logger.info(f"  - Conditions evaluated: {len(result.conditions_evaluated)}")
-                logger.info(f"  - Actions executed: {len(result.actions_executed)}")
+            if isinstance(exec_result, Exception):
+                logger.error("FAIL Execution failed: %s", exec_result)
+            else:
+                result = exec_result
+                logger.info("OK Execution completed: %s", 'Success' if result.success else 'Failed')
+                logger.info("  - Duration: %.2fs", result.duration)
+                logger.info("  - Conditions evaluated: %d", len(result.conditions_evaluated))
+                logger.info("  - Actions executed: %d", len(result.actions_executed))
                 
                 if result.errors:
                     logger.error("  - Errors:")
                     for error in result.errors:
-                        logger.error(f"    • {error}")
+                        logger.error("    - %s", error)
                         
-            except Exception as e:
-                logger.error(f"✗ Execution failed: {e}")
-                
     # Example: Convert rule back to YAML
-    logger.info(f"\n{'='*60}")
+    logger.info("\n%s", SEPARATOR)
     logger.info("Converting rule back to YAML")
-    logger.info(f"{'='*60}")
+    logger.info(SEPARATOR)
     
     if 'rule' in locals():
         yaml_output = parser.to_yaml(rule)
@@ -150,20 +204,20 @@ async def main():
         print(yaml_output)
         
     # Example: Compose multiple rules
-    logger.info(f"\n{'='*60}")
+    logger.info("\n%s", SEPARATOR)
     logger.info("Rule composition example")
-    logger.info(f"{'='*60}")
+    logger.info(SEPARATOR)
     
     if len(rule_files) >= 2:
-        # Parse two rules for composition
-        rule1 = parser.parse_file(rules_dir / rule_files[0])
-        rule2 = parser.parse_file(rules_dir / rule_files[1])
+        # Parse two rules for composition (served from the parse cache)
+        rule1 = parse_rule_file(rules_dir / rule_files[0])
+        rule2 = parse_rule_file(rules_dir / rule_files[1])
         
         # Compose rules
         composed_rule = compiler.compose_rules(rule1, rule2, composition_type="extend")
-        logger.info(f"✓ Composed rule created: {composed_rule.id}")
-        logger.info(f"  - Total conditions: {len(composed_rule.conditions)}")
-        logger.info(f"  - Total actions: {len(composed_rule.actions)}")
+        logger.info("OK Composed rule created: %s", composed_rule.id)
+        logger.info("  - Total conditions: %d", len(composed_rule.conditions))
+        logger.info("  - Total actions: %d", len(composed_rule.actions))
 
 
 if __name__ == "__main__":
@@ -9,8 +9,9 @@ This example shows how to:
 """
 
 import asyncio
+import functools
 import logging
-from datetime import datetime
+from time import time_ns
 
 from bizy import MetaOrchestrator, BusinessRule
 from bizy.core.business_rule import (
@@ -33,13 +34,14 @@ async def setup_demo_environment():
     # Initialize event bus
     event_bus = EventBus()
     
-    # Subscribe to events for monitoring
+    # Subscribe to events for monitoring; logging is optional so it never
+    # holds up rule execution
     def log_event(event):
         logger.info(f"Event: {event.event_type} - {event.data}")
         
-    event_bus.subscribe(EventType.RULE_EXECUTION_STARTED, log_event)
-    event_bus.subscribe(EventType.RULE_EXECUTION_COMPLETED, log_event)
-    event_bus.subscribe(EventType.RULE_EXECUTION_FAILED, log_event)
+    event_bus.subscribe(EventType.RULE_EXECUTION_STARTED, log_event, required=False)
+    event_bus.subscribe(EventType.RULE_EXECUTION_COMPLETED, log_event, required=False)
+    event_bus.subscribe(EventType.RULE_EXECUTION_FAILED, log_event, required=False)
     
     # Set up adapters with minimal config
     adapter_config = {
@@ -65,6 +67,85 @@ async def setup_demo_environment():
     return orchestrator, event_bus, registry
 
 
+@functools.lru_cache(maxsize=1024, typed=True)
+def _condition(field, operator, value):
+    """
+    Get a shared RuleCondition for a (field, operator, value) shape.
+    
+    Conditions are never mutated by the orchestrator, so rules created by
+    repeated setups (e.g. once per BDD scenario) can share one instance.
+    Values must be hashable; use tuples instead of lists for ``in``.
+    """
+    return RuleCondition(field, operator, value)
+
+
+# Actions with static parameters are built once and shared by every rule set
+_SENTIMENT_ANALYSIS_ACTION = RuleAction(
+    framework="langchain",
+    action="analyze_document",
+    parameters={
+        "analysis_type": "sentiment",
+        "content": "Customer complaint text here"
+    }
+)
+
+_ESCALATION_MEMORY_ACTION = RuleAction(
+    framework="zep",
+    action="store_memory",
+    parameters={
+        "type": "interaction",
+        "content": "Customer escalation triggered"
+    }
+)
+
+_BATCH_TRANSFORM_ACTION = RuleAction(
+    framework="fastmcp",
+    action="batch_execute",
+    parameters={
+        "executions": [
+            {
+                "tool_name": "batch_processor",
+                "parameters": {
+                    "operation": "transform",
+                    "data": []
+                }
+            }
+        ],
+        "parallel": True
+    }
+)
+
+_CSV_TRANSFORM_ACTION = RuleAction(
+    framework="mcp",
+    action="execute_tool",
+    parameters={
+        "tool_name": "data_transformer",
+        "parameters": {
+            "from_format": "json",
+            "to_format": "csv"
+        }
+    }
+)
+
+_EXTRACT_KEYWORDS_ACTION = RuleAction(
+    framework="semantic_kernel",
+    action="run_skill",
+    parameters={
+        "skill_name": "Text",
+        "function_name": "ExtractKeywords"
+    }
+)
+
+_EXTRACT_FACTS_ACTION = RuleAction(
+    framework="zep",
+    action="extract_facts",
+    parameters={
+        "fact_type": "document_facts",
+        "confidence": 0.8
+    }
+)
+
+
 async def create_demo_rules():
     """Create demonstration business rules."""
     
@@ -76,34 +157,21 @@ async def create_demo_rules():
         rule_type=RuleType.WORKFLOW,
         priority=RulePriority.HIGH,
         conditions=[
-            RuleCondition("sentiment_score", "lt", 0.3),
-            RuleCondition("customer_tier", "in", ["premium", "enterprise"])
+            _condition("sentiment_score", "lt", 0.3),
+            _condition("customer_tier", "in", ("premium", "enterprise"))
         ],
         actions=[
-            RuleAction(
-                framework="langchain",
-                action="analyze_document",
-                parameters={
-                    "analysis_type": "sentiment",
-                    "content": "Customer complaint text here"
-                }
-            ),
+            _SENTIMENT_ANALYSIS_ACTION,
+            # The workflow id is unique per rule set, so this action is not shared
             RuleAction(
                 framework="temporal",
                 action="start_workflow",
                 parameters={
                     "workflow_name": "customer_escalation",
-                    "workflow_id": f"escalation_{datetime.now().timestamp()}"
+                    "workflow_id": f"escalation_{time_ns()}"
                 }
             ),
-            RuleAction(
-                framework="zep",
-                action="store_memory",
-                parameters={
-                    "type": "interaction",
-                    "content": "Customer escalation triggered"
-                }
-            )
+            _ESCALATION_MEMORY_ACTION
         ],
         description="Escalate premium customers with negative sentiment"
     )
@@ -115,37 +183,12 @@ async def create_demo_rules():
         rule_type=RuleType.ACTION,
         priority=RulePriority.MEDIUM,
         conditions=[
-            RuleCondition("data_size", "gt", 100),
-            RuleCondition("processing_required", "eq", True)
+            _condition("data_size", "gt", 100),
+            _condition("processing_required", "eq", True)
         ],
         actions=[
-            RuleAction(
-                framework="fastmcp",
-                action="batch_execute",
-                parameters={
-                    "executions": [
-                        {
-                            "tool_name": "batch_processor",
-                            "parameters": {
-                                "operation": "transform",
-                                "data": []
-                            }
-                        }
-                    ],
-                    "parallel": True
-                }
-            ),
-            RuleAction(
-                framework="mcp",
-                action="execute_tool",
-                parameters={
-                    "tool_name": "data_transformer",
-                    "parameters": {
-                        "from_format": "json",
-                        "to_format": "csv"
-                    }
-                }
-            )
+            _BATCH_TRANSFORM_ACTION,
+            _CSV_TRANSFORM_ACTION
         ],
         description="Process large datasets using optimized tools"
     )
@@ -157,26 +200,12 @@ async def create_demo_rules():
         rule_type=RuleType.POLICY,
         priority=RulePriority.LOW,
         conditions=[
-            RuleCondition("content_type", "eq", "document"),
-            RuleCondition("extract_knowledge", "eq", True)
+            _condition("content_type", "eq", "document"),
+            _condition("extract_knowledge", "eq", True)
         ],
         actions=[
-            RuleAction(
-                framework="semantic_kernel",
-                action="run_skill",
-                parameters={
-                    "skill_name": "Text",
-                    "function_name": "ExtractKeywords"
-                }
-            ),
-            RuleAction(
-                framework="zep",
-                action="extract_facts",
-                parameters={
-                    "fact_type": "document_facts",
-                    "confidence": 0.8
-                }
-            )
+            _EXTRACT_KEYWORDS_ACTION,
+            _EXTRACT_FACTS_ACTION
         ],
         description="Extract knowledge from documents"
     )
@@ -7,6 +7,7 @@ scenario execution and cleanup with the existing orchestration system.
 
 import asyncio
 import logging
+import logging.handlers
 from pathlib import Path
 import sys
 
@@ -18,26 +19,39 @@ from business_logic_orchestrator.core.meta_orchestrator import MetaOrchestrator
 from business_logic_orchestrator.bdd.scenario_executor import BDDScenarioExecutor
 from business_logic_orchestrator.events import EventBus
 
-# Configure logging for tests
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+# Configure logging for tests. Records are buffered in memory and written
+# in batches, or immediately once an error (e.g. a failed step) is logged.
+_log_stream = logging.StreamHandler()
+_log_stream.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+_log_buffer = logging.handlers.MemoryHandler(
+    capacity=512,
+    flushLevel=logging.ERROR,
+    target=_log_stream
 )
+logging.basicConfig(level=logging.INFO, handlers=[_log_buffer])
 logger = logging.getLogger(__name__)
 
 
 def before_all(context):
     """Set up global test environment before all scenarios."""
-    print("🚀 Starting Business Logic Orchestrator BDD Tests")
+    logger.info("🚀 Starting Business Logic Orchestrator BDD Tests")
     
-    # Set up async event loop for testing
+    # Set up async event loop for testing, using uvloop when it is installed
     if not hasattr(context, 'loop'):
-        context.loop = asyncio.new_event_loop()
+        try:
+            import uvloop
+            context.loop = uvloop.new_event_loop()
+        except ImportError:
+            context.loop = asyncio.new_event_loop()
         asyncio.set_event_loop(context.loop)
     
-    # Initialize global test components
-    context.global_orchestrator = None
-    context.global_bdd_executor = None
+    # Bind the loop clock once instead of looking the loop up in every hook
+    context.clock = context.loop.time
+    
+    # Initialize global test components once; scenarios reset them in place
+    context.global_event_bus = EventBus()
+    context.global_orchestrator = MetaOrchestrator(context.global_event_bus)
+    context.global_bdd_executor = BDDScenarioExecutor(context.global_orchestrator)
     
     # Test configuration
     context.test_config = {
@@ -49,25 +63,32 @@ def before_all(context):
 
 def before_feature(context, feature):
     """Set up environment before each feature."""
-    print(f"📁 Starting feature: {feature.name}")
+    logger.info(f"📁 Starting feature: {feature.name}")
     
     # Feature-specific setup can be added here
-    context.feature_start_time = asyncio.get_event_loop().time()
+    context.feature_start_time = context.clock()
 
 
 def before_scenario(context, scenario):
     """Set up environment before each scenario."""
-    print(f"📋 Starting scenario: {scenario.name}")
+    logger.info(f"📋 Starting scenario: {scenario.name}")
+    
+    # Reuse the shared orchestrator, resetting its state for isolation
+    context.event_bus = context.global_event_bus
+    context.orchestrator = context.global_orchestrator
+    context.bdd_executor = context.global_bdd_executor
+    
+    context.event_bus.reset()
+    context.orchestrator.clear_rules()
+    context.bdd_executor.execution_history.clear()
     
-    # Create fresh orchestrator for each scenario to ensure isolation
-    context.event_bus = EventBus()
-    context.orchestrator = MetaOrchestrator(context.event_bus)
-    context.bdd_executor = BDDScenarioExecutor(context.orchestrator)
+    # Snapshot registered adapters so after_scenario can undo registrations
+    context.adapter_snapshot = dict(context.orchestrator.adapters)
     
     # Reset scenario-specific state
     context.execution_results = {}
     context.performance_metrics = {}
-    context.scenario_start_time = asyncio.get_event_loop().time()
+    context.scenario_start_time = context.clock()
     
     # Set up test data containers
     context.customers = {}
@@ -78,12 +99,12 @@ def before_scenario(context, scenario):
 
 def after_scenario(context, scenario):
     """Clean up after each scenario."""
-    scenario_duration = asyncio.get_event_loop().time() - context.scenario_start_time
+    scenario_duration = context.clock() - context.scenario_start_time
     
     if scenario.status == "passed":
-        print(f"✅ Scenario passed: {scenario.name} ({scenario_duration:.2f}s)")
+        logger.info(f"✅ Scenario passed: {scenario.name} ({scenario_duration:.2f}s)")
     else:
-        print(f"❌ Scenario failed: {scenario.name} ({scenario_duration:.2f}s)")
+        logger.error(f"❌ Scenario failed: {scenario.name} ({scenario_duration:.2f}s)")
         
         # Log failure details for debugging
         if hasattr(context, 'execution_results'):
@@ -96,23 +117,22 @@ def after_scenario(context, scenario):
                 if hasattr(step, 'exception'):
                     logger.error(f"Exception: {step.exception}")
     
-    # Clean up resources
-    if hasattr(context, 'orchestrator') and context.orchestrator:
-        # In a real implementation, this would clean up adapter connections
-        # For now, we just clear references
-        context.orchestrator = None
-        context.bdd_executor = None
+    # Restore the shared orchestrator's adapters to their pre-scenario state
+    if hasattr(context, 'adapter_snapshot'):
+        adapters = context.global_orchestrator.adapters
+        adapters.clear()
+        adapters.update(context.adapter_snapshot)
 
 
 def after_feature(context, feature):
     """Clean up after each feature."""
-    feature_duration = asyncio.get_event_loop().time() - context.feature_start_time
+    feature_duration = context.clock() - context.feature_start_time
     
     passed_scenarios = len([s for s in feature.scenarios if s.status == "passed"])
     total_scenarios = len(feature.scenarios)
     
-    print(f"📊 Feature complete: {feature.name}")
-    print(f"    Scenarios: {passed_scenarios}/{total_scenarios} passed ({feature_duration:.2f}s)")
+    logger.info(f"📊 Feature complete: {feature.name}")
+    logger.info(f"    Scenarios: {passed_scenarios}/{total_scenarios} passed ({feature_duration:.2f}s)")
 
 
 def after_all(context):
@@ -124,7 +144,8 @@ def after_all(context):
         except Exception as e:
             logger.warning(f"Error closing event loop: {e}")
     
-    print("🏁 Business Logic Orchestrator BDD Tests Complete")
+    logger.info("🏁 Business Logic Orchestrator BDD Tests Complete")
+    _log_buffer.flush()
 
 
 # Behave configuration hooks
@@ -137,25 +158,26 @@ def before_step(context, step):
 def after_step(context, step):
     """After each step execution."""
     if step.status == "failed":
-        print(f"💥 Step failed: {step.name}")
+        logger.error(f"💥 Step failed: {step.name}")
         
-        # Capture debug information
-        if hasattr(context, 'orchestrator'):
-            # Log orchestrator state
-            logger.error("Orchestrator state at failure:")
-            logger.error(f"  Registered adapters: {list(context.orchestrator.adapters.keys())}")
+        # Scenario state is set up together in before_scenario, so a single
+        # lookup failure means none of it is available
+        try:
+            orchestrator = context.orchestrator
+            test_data = {
+                'customers': context.customers,
+                'tasks': context.tasks,
+                'frameworks': context.frameworks
+            }
+        except AttributeError:
+            return
             
+        # Log orchestrator state
+        logger.error("Orchestrator state at failure:")
+        logger.error(f"  Registered adapters: {list(orchestrator.adapters.keys())}")
+        
         # Log any available test context
-        test_data = {}
-        if hasattr(context, 'customers'):
-            test_data['customers'] = context.customers
-        if hasattr(context, 'tasks'):
-            test_data['tasks'] = context.tasks
-        if hasattr(context, 'frameworks'):
-            test_data['frameworks'] = context.frameworks
-            
-        if test_data:
-            logger.error(f"Test context: {test_data}")
+        logger.error(f"Test context: {test_data}")
 
 
 # Tag-based hooks for different test types
@@ -164,15 +186,15 @@ def before_tag(context, tag):
     if tag == "integration":
         # Set up for integration tests
         context.test_mode = "integration"
-        print("🔗 Running integration test")
+        logger.info("🔗 Running integration test")
     elif tag == "smoke":
         # Set up for smoke tests
         context.test_mode = "smoke"
-        print("💨 Running smoke test")
+        logger.info("💨 Running smoke test")
     elif tag == "cross_framework":
         # Set up for cross-framework tests
         context.test_mode = "cross_framework"
-        print("🌐 Running cross-framework test")
+        logger.info("🌐 Running cross-framework test")
 
 
 def after_tag(context, tag):
@@ -8,13 +8,39 @@ to AI system execution.
 """
 
 import asyncio
+import os
 import sys
+from collections import defaultdict
 from pathlib import Path
 
 # Add project root to path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+def find_missing_files(expected_files):
+    """
+    Return the expected files that do not exist.
+    
+    Each parent directory is listed once with os.scandir instead of
+    stat-ing every file, so only the directories named in
+    ``expected_files`` are visited.
+    """
+    names_by_dir = defaultdict(list)
+    for file_path in expected_files:
+        parent, _, name = file_path.rpartition("/")
+        names_by_dir[parent or "."].append((file_path, name))
+    
+    missing_files = []
+    for directory, entries in names_by_dir.items():
+        try:
+            with os.scandir(directory) as it:
+                present = {entry.name for entry in it if entry.is_file()}
+        except OSError:
+            present = set()
+        missing_files.extend(path for path, name in entries if name not in present)
+    
+    return missing_files
+
 async def main():
     """Run final validation of the complete system."""
     print("🔍 Final System Validation")
@@ -110,10 +136,7 @@ async def main():
         "README.md"
     ]
     
-    missing_files = []
-    for file_path in expected_files:
-        if not Path(file_path).exists():
-            missing_files.append(file_path)
+    missing_files = find_missing_files(expected_files)
     
     if not missing_files:
         print(f"✅ All {len(expected_files)} expected files present")
@@ -6,9 +6,15 @@ orchestration.
 """
 
 import asyncio
+import contextlib
+import functools
 import logging
 import os
-from typing import Any, Dict, List, Optional
+import re
+import statistics
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -35,17 +41,241 @@ from bizy.adapters import (
 from bizy.events import EventBus
 from bizy.rules import RuleEngine
 
+# Number of benchmark operations kept in flight at once
+BENCHMARK_WINDOW = 32
+
+
+# Coordination plan steps executing at once
+COORDINATION_MAX_INFLIGHT = 8
+
+# Per-framework limits on calls to external services
+FRAMEWORK_MAX_INFLIGHT = 16
+FRAMEWORK_RATE_LIMIT = 50.0  # requests per second
+
+# Retry policy for framework actions: exponential backoff between attempts.
+# Only timeouts are retried; other errors may mean the action already ran.
+ACTION_RETRY_ATTEMPTS = 3
+ACTION_RETRY_BASE_DELAY = 0.25
+ACTION_RETRY_MAX_DELAY = 4.0
+RETRYABLE_ERRORS = (asyncio.TimeoutError, TimeoutError)
+
+# Seconds before a hedged request sends its duplicate (roughly P95 latency)
+HEDGE_DELAY = 0.5
+
+# "{previous.result}" or "{step[N].result}" inside a plan step's params
+_STEP_REFERENCE = re.compile(r"\{(?:previous|step\[(\d+)\])\.result\}")
+_CONTEXT_REFERENCE = "{context}"
+
+
+async def _timed(coro) -> int:
+    """Await a coroutine and return its latency in nanoseconds."""
+    start = time.perf_counter_ns()
+    await coro
+    return time.perf_counter_ns() - start
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter for async callers.
+    
+    Tokens refill continuously at ``rate`` per second up to ``capacity``,
+    so short bursts are allowed while the sustained rate stays bounded.
+    """
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+        
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+@dataclass(frozen=True, slots=True)
+class AdapterConfig:
+    """Adapter settings read from the environment once at startup."""
+    langchain_api_key: str
+    langchain_model: str
+    langchain_temperature: float
+    temporal_host: str
+    temporal_port: int
+    temporal_namespace: str
+    mcp_server_url: str
+    mcp_auth_token: str
+    semantic_kernel_api_key: str
+    semantic_kernel_skills_dir: str
+    zep_api_url: str
+    zep_api_key: str
+    
+    @classmethod
+    def from_env(cls) -> "AdapterConfig":
+        """Snapshot adapter settings from environment variables."""
+        env = os.environ
+        return cls(
+            langchain_api_key=env.get("LANGCHAIN_API_KEY", ""),
+            langchain_model=env.get("LANGCHAIN_MODEL", "gpt-4"),
+            langchain_temperature=float(env.get("LANGCHAIN_TEMPERATURE", "0.7")),
+            temporal_host=env.get("TEMPORAL_HOST", "localhost"),
+            temporal_port=int(env.get("TEMPORAL_PORT", "7233")),
+            temporal_namespace=env.get("TEMPORAL_NAMESPACE", "default"),
+            mcp_server_url=env.get("MCP_SERVER_URL", "http://localhost:8080"),
+            mcp_auth_token=env.get("MCP_AUTH_TOKEN", ""),
+            semantic_kernel_api_key=env.get("SEMANTIC_KERNEL_API_KEY", ""),
+            semantic_kernel_skills_dir=env.get("SEMANTIC_KERNEL_SKILLS_DIR", "skills/"),
+            zep_api_url=env.get("ZEP_API_URL", "http://localhost:8000"),
+            zep_api_key=env.get("ZEP_API_KEY", "")
+        )
+
+
+async def hedged(coro_factory, *, delay: float, attempts: int = 2) -> Any:
+    """
+    Run a request, sending a duplicate if it is slower than ``delay``.
+    
+    Whichever copy succeeds first wins and the others are cancelled. A copy
+    that fails early triggers the next one immediately; the last error is
+    raised only if every copy fails.
+    
+    Args:
+        coro_factory: Zero-argument function returning a new coroutine
+        delay: Seconds to wait before sending each duplicate
+        attempts: Maximum number of copies in flight
+        
+    Returns:
+        Result of the first successful copy
+    """
+    pending = set()
+    launched = 0
+    last_error = None
+    
+    try:
+        while True:
+            if launched < attempts:
+                pending.add(asyncio.create_task(coro_factory()))
+                launched += 1
+            elif not pending:
+                raise last_error
+                
+            done, pending = await asyncio.wait(
+                pending,
+                timeout=delay if launched < attempts else None,
+                return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                last_error = task.exception()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def _step_dependencies(index: int, step: Dict[str, Any]) -> Set[int]:
+    """
+    Find the earlier plan steps whose results a step consumes.
+    
+    Args:
+        index: Position of the step in the plan
+        step: Plan step with optional ``params``
+        
+    Returns:
+        Indices of the steps that must finish first
+    """
+    dependencies = set()
+    
+    for value in step.get("params", {}).values():
+        if not isinstance(value, str):
+            continue
+        if _CONTEXT_REFERENCE in value:
+            # The accumulated context needs every earlier step
+            dependencies.update(range(index))
+        for match in _STEP_REFERENCE.finditer(value):
+            dependency = index - 1 if match.group(1) is None else int(match.group(1))
+            if not 0 <= dependency < index:
+                raise ValueError(f"Step {index} references unavailable step result: {match.group(0)}")
+            dependencies.add(dependency)
+            
+    return dependencies
+
+
+def _resolve_step_params(params: Dict[str, Any], index: int, results: List[Any]) -> Dict[str, Any]:
+    """Substitute result placeholders in a step's params with earlier results."""
+    def lookup(match):
+        return results[index - 1 if match.group(1) is None else int(match.group(1))]
+    
+    resolved = {}
+    for key, value in params.items():
+        if not isinstance(value, str):
+            resolved[key] = value
+        elif value == _CONTEXT_REFERENCE:
+            resolved[key] = results[:index]
+        else:
+            match = _STEP_REFERENCE.fullmatch(value)
+            if match:
+                # A bare placeholder passes the result object through as-is
+                resolved[key] = lookup(match)
+            else:
+                resolved[key] = _STEP_REFERENCE.sub(lambda m: str(lookup(m)), value)
+                
+    return resolved
+
 
 class ReferenceImplementation:
     """Complete reference implementation of Bizy."""
     
-    def __init__(self, config_path: Optional[Path] = None):
-        """Initialize reference implementation with configuration."""
+    def __init__(self, config_path: Optional[Path] = None, hedge_requests: bool = True):
+        """
+        Initialize reference implementation with configuration.
+        
+        Args:
+            config_path: Path to the reference configuration
+            hedge_requests: Whether latency-critical calls send a duplicate
+                request when slow; disable for offline benchmarking
+        """
         self.config_path = config_path or Path("config/reference.yaml")
+        self.hedge_requests = hedge_requests
+        self.adapter_config = AdapterConfig.from_env()
         self.orchestrator = None
         self.event_bus = None
         self.rule_engine = None
         self.adapters = {}
+        self._framework_limits: Dict[str, Tuple[asyncio.Semaphore, TokenBucket]] = {}
+        # Loop-bound state (locks, semaphores, connections) belongs to the
+        # event loop it was created on; see ensure_initialized
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._init_lock: Optional[asyncio.Lock] = None
+        self._initialized = False
+        
+    async def ensure_initialized(self) -> None:
+        """
+        Initialize the implementation unless it already is.
+        
+        Concurrent callers wait for a single initialization instead of each
+        connecting adapters and loading rules again. When called from a new
+        event loop (e.g. a second asyncio.run), state bound to the previous
+        loop is discarded and the implementation is initialized afresh.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._reset()
+            self._loop = loop
+            self._init_lock = asyncio.Lock()
+        if self._initialized:
+            return
+        async with self._init_lock:
+            if not self._initialized:
+                await self.initialize()
+                self._initialized = True
         
     async def initialize(self) -> None:
         """Initialize all components of the reference implementation."""
@@ -74,64 +304,53 @@ class ReferenceImplementation:
         logger.info("Reference Implementation initialized successfully")
     
     async def _initialize_adapters(self) -> None:
-        """Initialize all framework adapters."""
-        # LangChain adapter
-        langchain_adapter = LangChainAdapter({
-            "api_key": os.getenv("LANGCHAIN_API_KEY", ""),
-            "model": os.getenv("LANGCHAIN_MODEL", "gpt-4"),
-            "temperature": float(os.getenv("LANGCHAIN_TEMPERATURE", "0.7"))
-        })
-        await langchain_adapter.connect()
-        self.orchestrator.register_adapter("langchain", langchain_adapter)
-        self.adapters["langchain"] = langchain_adapter
-        
-        # Temporal adapter
-        temporal_adapter = TemporalAdapter({
-            "host": os.getenv("TEMPORAL_HOST", "localhost"),
-            "port": int(os.getenv("TEMPORAL_PORT", "7233")),
-            "namespace": os.getenv("TEMPORAL_NAMESPACE", "default")
-        })
-        await temporal_adapter.connect()
-        self.orchestrator.register_adapter("temporal", temporal_adapter)
-        self.adapters["temporal"] = temporal_adapter
-        
-        # MCP adapter
-        mcp_adapter = MCPAdapter({
-            "server_url": os.getenv("MCP_SERVER_URL", "http://localhost:8080"),
-            "auth_token": os.getenv("MCP_AUTH_TOKEN", "")
-        })
-        await mcp_adapter.connect()
-        self.orchestrator.register_adapter("mcp", mcp_adapter)
-        self.adapters["mcp"] = mcp_adapter
-        
-        # Semantic Kernel adapter
-        sk_adapter = SemanticKernelAdapter({
-            "api_key": os.getenv("SEMANTIC_KERNEL_API_KEY", ""),
-            "skills_directory": os.getenv("SEMANTIC_KERNEL_SKILLS_DIR", "skills/")
-        })
-        await sk_adapter.connect()
-        self.orchestrator.register_adapter("semantic_kernel", sk_adapter)
-        self.adapters["semantic_kernel"] = sk_adapter
-        
-        # FastMCP adapter
-        fastmcp_adapter = FastMCPAdapter({
-            "server_name": "reference-server",
-            "tools_directory": "tools/"
-        })
-        await fastmcp_adapter.connect()
-        self.orchestrator.register_adapter("fastmcp", fastmcp_adapter)
-        self.adapters["fastmcp"] = fastmcp_adapter
-        
-        # Zep adapter
-        zep_adapter = ZepAdapter({
-            "api_url": os.getenv("ZEP_API_URL", "http://localhost:8000"),
-            "api_key": os.getenv("ZEP_API_KEY", "")
-        })
-        await zep_adapter.connect()
-        self.orchestrator.register_adapter("zep", zep_adapter)
-        self.adapters["zep"] = zep_adapter
+        """Initialize all framework adapters, connecting them concurrently."""
+        cfg = self.adapter_config
+        adapters = {
+            "langchain": LangChainAdapter({
+                "api_key": cfg.langchain_api_key,
+                "model": cfg.langchain_model,
+                "temperature": cfg.langchain_temperature
+            }),
+            "temporal": TemporalAdapter({
+                "host": cfg.temporal_host,
+                "port": cfg.temporal_port,
+                "namespace": cfg.temporal_namespace
+            }),
+            "mcp": MCPAdapter({
+                "server_url": cfg.mcp_server_url,
+                "auth_token": cfg.mcp_auth_token
+            }),
+            "semantic_kernel": SemanticKernelAdapter({
+                "api_key": cfg.semantic_kernel_api_key,
+                "skills_directory": cfg.semantic_kernel_skills_dir
+            }),
+            "fastmcp": FastMCPAdapter({
+                "server_name": "reference-server",
+                "tools_directory": "tools/"
+            }),
+            "zep": ZepAdapter({
+                "api_url": cfg.zep_api_url,
+                "api_key": cfg.zep_api_key
+            })
+        }
+        
+        # Connect concurrently so startup costs the slowest handshake rather
+        # than the sum of all of them
+        results = await asyncio.gather(
+            *(adapter.connect() for adapter in adapters.values()),
+            return_exceptions=True
+        )
         
-        logger.info("All adapters initialized and registered")
+        # Register only the adapters that connected, in declaration order
+        for (name, adapter), result in zip(adapters.items(), results):
+            if isinstance(result, Exception):
+                logger.error("Failed to connect %s adapter: %s", name, result)
+                continue
+            self.orchestrator.register_adapter(name, adapter)
+            self.adapters[name] = adapter
+        
+        logger.info("%d/%d adapters initialized and registered", len(self.adapters), len(adapters))
     
     async def _setup_monitoring(self) -> None:
         """Set up monitoring and observability."""
@@ -163,75 +382,82 @@ class ReferenceImplementation:
         customer_message = "I'm very frustrated with my recent order!"
         customer_id = "CUST-12345"
         
-        # Step 1: Analyze sentiment with LangChain
-        sentiment_result = await self.orchestrator.execute_action(
-            framework="langchain",
-            action="analyze_sentiment",
-            params={
-                "text": customer_message,
-                "include_emotions": True
-            }
-        )
-        logger.info(f"Sentiment Analysis: {sentiment_result}")
-        
-        # Step 2: Fetch customer data with MCP
-        customer_data = await self.orchestrator.execute_action(
-            framework="mcp",
-            action="get_customer_profile",
-            params={"customer_id": customer_id}
-        )
-        logger.info(f"Customer Data: {customer_data}")
-        
-        # Step 3: Store interaction in Zep memory
-        memory_result = await self.orchestrator.execute_action(
-            framework="zep",
-            action="store_interaction",
-            params={
-                "user_id": customer_id,
-                "message": customer_message,
-                "metadata": sentiment_result
-            }
+        # Steps 1 and 2 are independent: analyze sentiment with LangChain
+        # while fetching customer data with MCP
+        sentiment_result, customer_data = await asyncio.gather(
+            self._execute_latency_critical(
+                framework="langchain",
+                action="analyze_sentiment",
+                params={
+                    "text": customer_message,
+                    "include_emotions": True
+                }
+            ),
+            self._call_with_retry(
+                framework="mcp",
+                action="get_customer_profile",
+                params={"customer_id": customer_id}
+            )
         )
+        logger.info("Sentiment Analysis: %s", sentiment_result)
+        logger.info("Customer Data: %s", customer_data)
         
-        # Step 4: Evaluate business rules
+        # Steps 3 and 4 both only need the results above: store the
+        # interaction in Zep memory while evaluating business rules
         rule_context = {
             "customer": customer_data,
             "sentiment": sentiment_result,
             "message": customer_message
         }
         
-        rule_decision = await self.orchestrator.evaluate_rules(
-            rule_set="customer_service",
-            context=rule_context
+        memory_result, rule_decision = await asyncio.gather(
+            self._call_with_retry(
+                framework="zep",
+                action="store_interaction",
+                params={
+                    "user_id": customer_id,
+                    "message": customer_message,
+                    "metadata": sentiment_result
+                },
+                retry=False
+            ),
+            self.orchestrator.evaluate_rules(
+                rule_set="customer_service",
+                context=rule_context
+            )
         )
-        logger.info(f"Rule Decision: {rule_decision}")
+        logger.info("Rule Decision: %s", rule_decision)
         
         # Step 5: Execute decision-based actions
-        if rule_decision["decision"] == "escalate":
+        decision = rule_decision["decision"]
+        workflow_id = None
+        if decision == "escalate":
             # Start Temporal workflow for escalation
-            workflow_result = await self.orchestrator.execute_action(
+            workflow_result = await self._call_with_retry(
                 framework="temporal",
                 action="start_escalation_workflow",
                 params={
                     "customer_id": customer_id,
                     "priority": "high",
                     "context": rule_context
-                }
+                },
+                retry=False
             )
+            workflow_id = workflow_result.get("workflow_id")
             
             # Generate response with Semantic Kernel
-            response = await self.orchestrator.execute_action(
+            response = await self._call_with_retry(
                 framework="semantic_kernel",
                 action="generate_escalation_response",
                 params={
                     "customer_name": customer_data.get("name"),
                     "issue": sentiment_result.get("main_concern"),
-                    "ticket_id": workflow_result.get("workflow_id")
+                    "ticket_id": workflow_id
                 }
             )
         else:
             # Generate standard response
-            response = await self.orchestrator.execute_action(
+            response = await self._execute_latency_critical(
                 framework="semantic_kernel",
                 action="generate_response",
                 params={
@@ -241,24 +467,37 @@ class ReferenceImplementation:
             )
         
         # Step 6: Log with FastMCP
-        await self.orchestrator.execute_action(
+        await self._call_with_retry(
             framework="fastmcp",
             action="log_interaction",
             params={
                 "interaction_id": memory_result.get("session_id"),
                 "customer_id": customer_id,
                 "resolution": response
-            }
+            },
+            retry=False
         )
         
         return {
             "customer_message": customer_message,
             "sentiment": sentiment_result,
-            "decision": rule_decision["decision"],
+            "decision": decision,
             "response": response,
-            "workflow_id": workflow_result.get("workflow_id") if rule_decision["decision"] == "escalate" else None
+            "workflow_id": workflow_id
         }
     
+    async def _execute_latency_critical(self, framework: str, action: str, params: Dict[str, Any]) -> Any:
+        """Execute a user-facing action, hedging it when enabled."""
+        if not self.hedge_requests:
+            return await self._call_with_retry(framework, action, params)
+            
+        # The hedge already sends a second request, so attempts are not
+        # retried on top of it
+        return await hedged(
+            lambda: self._call_with_retry(framework, action, params, retry=False),
+            delay=HEDGE_DELAY
+        )
+    
     async def demonstrate_document_processing_pipeline(self) -> Dict[str, Any]:
         """Demonstrate document processing across frameworks."""
         logger.info("Starting Document Processing Pipeline Demonstration")
@@ -267,12 +506,12 @@ class ReferenceImplementation:
         
         # Parallel processing with multiple frameworks
         tasks = [
-            self.orchestrator.execute_action(
+            self._call_with_retry(
                 framework="mcp",
                 action="extract_text",
                 params={"document_path": document_path}
             ),
-            self.orchestrator.execute_action(
+            self._call_with_retry(
                 framework="fastmcp",
                 action="extract_metadata",
                 params={"file_path": document_path}
@@ -284,7 +523,7 @@ class ReferenceImplementation:
         metadata = extraction_results[1]["metadata"]
         
         # Analyze with LangChain
-        analysis = await self.orchestrator.execute_action(
+        analysis = await self._call_with_retry(
             framework="langchain",
             action="analyze_document",
             params={
@@ -294,7 +533,7 @@ class ReferenceImplementation:
         )
         
         # Store in Zep for future reference
-        storage_result = await self.orchestrator.execute_action(
+        storage_result = await self._call_with_retry(
             framework="zep",
             action="store_document",
             params={
@@ -302,27 +541,32 @@ class ReferenceImplementation:
                 "content": text_content,
                 "analysis": analysis,
                 "metadata": metadata
-            }
+            },
+            retry=False
         )
         
+        document_id = storage_result["document_id"]
+        
         # Create workflow if action required
+        workflow = None
         if analysis.get("requires_review", False):
-            workflow = await self.orchestrator.execute_action(
+            workflow = await self._call_with_retry(
                 framework="temporal",
                 action="start_document_review",
                 params={
-                    "document_id": storage_result["document_id"],
+                    "document_id": document_id,
                     "issues": analysis.get("issues", []),
                     "deadline": analysis.get("suggested_deadline")
-                }
+                },
+                retry=False
             )
         
         return {
             "document": document_path,
             "metadata": metadata,
             "analysis": analysis,
-            "storage_id": storage_result["document_id"],
-            "review_workflow": workflow if analysis.get("requires_review") else None
+            "storage_id": document_id,
+            "review_workflow": workflow
         }
     
     async def demonstrate_cross_framework_coordination(self) -> Dict[str, Any]:
@@ -363,15 +607,135 @@ class ReferenceImplementation:
             }
         ]
         
-        # Execute coordination
-        result = await self.orchestrator.coordinate_frameworks(
-            plan=coordination_plan,
-            execution_mode="sequential",
-            error_handling="continue_on_error"
-        )
+        # Execute coordination; steps that don't consume each other's
+        # results run concurrently
+        result = await self._run_coordination_plan(coordination_plan)
         
         return result
     
+    async def _run_coordination_plan(
+        self,
+        plan: List[Dict[str, Any]],
+        max_inflight: int = COORDINATION_MAX_INFLIGHT
+    ) -> Dict[str, Any]:
+        """
+        Execute a coordination plan as a dependency graph.
+        
+        Each step waits only for the steps whose results it references via
+        ``{previous.result}``, ``{step[N].result}`` or ``{context}``, so
+        wall-clock time follows the critical path instead of the sum of all
+        steps. Failed steps are recorded and do not stop the plan.
+        
+        Args:
+            plan: Ordered list of steps with framework, action and params
+            max_inflight: Maximum number of steps executing at once
+            
+        Returns:
+            Per-step results in plan order
+        """
+        # Validate every reference before anything is started
+        dependencies = [_step_dependencies(i, step) for i, step in enumerate(plan)]
+        
+        semaphore = asyncio.Semaphore(max_inflight)
+        results: List[Any] = [None] * len(plan)
+        tasks: List[asyncio.Task] = []
+        
+        async def run_step(index: int, step: Dict[str, Any]) -> None:
+            if dependencies[index]:
+                await asyncio.gather(*(tasks[d] for d in dependencies[index]))
+            params = _resolve_step_params(step.get("params", {}), index, results)
+            results[index] = await self._execute_with_retry(
+                step["framework"], step["action"], params, semaphore
+            )
+            
+        async with asyncio.TaskGroup() as tg:
+            for index, step in enumerate(plan):
+                tasks.append(tg.create_task(run_step(index, step)))
+                
+        return {
+            "execution_mode": "dependency_graph",
+            "steps": [
+                {"framework": step["framework"], "action": step["action"], "result": result}
+                for step, result in zip(plan, results)
+            ]
+        }
+    
+    async def _execute_with_retry(
+        self,
+        framework: str,
+        action: str,
+        params: Dict[str, Any],
+        semaphore: asyncio.Semaphore
+    ) -> Any:
+        """
+        Execute a plan step's action with retries.
+        
+        After the last attempt the error is returned instead of raised so
+        dependent steps can still run.
+        """
+        try:
+            return await self._call_with_retry(framework, action, params, semaphore)
+        except Exception as e:
+            return {"error": str(e)}
+    
+    def _limits_for(self, framework: str) -> Tuple[asyncio.Semaphore, TokenBucket]:
+        """Get the concurrency and rate limits for a framework."""
+        limits = self._framework_limits.get(framework)
+        if limits is None:
+            limits = self._framework_limits[framework] = (
+                asyncio.Semaphore(FRAMEWORK_MAX_INFLIGHT),
+                TokenBucket(FRAMEWORK_RATE_LIMIT)
+            )
+        return limits
+    
+    async def _call_with_retry(
+        self,
+        framework: str,
+        action: str,
+        params: Dict[str, Any],
+        semaphore: Optional[asyncio.Semaphore] = None,
+        retry: bool = True
+    ) -> Any:
+        """
+        Execute a framework action within its limits, retrying timeouts.
+        
+        Each attempt holds a slot of the framework's semaphore (and of
+        ``semaphore``, if given) and takes a token from its rate limiter.
+        Slots are released while backing off, so waiting retries never
+        block other calls.
+        
+        Args:
+            framework: Framework to execute the action on
+            action: Action name
+            params: Action parameters
+            semaphore: Optional additional concurrency limit
+            retry: Whether to retry timed-out attempts; pass False for
+                actions with side effects, which a timeout may not have
+                prevented
+            
+        Returns:
+            Result of the first successful attempt
+        """
+        framework_semaphore, bucket = self._limits_for(framework)
+        attempts = ACTION_RETRY_ATTEMPTS if retry else 1
+        
+        for attempt in range(attempts):
+            try:
+                async with semaphore or contextlib.nullcontext(), framework_semaphore:
+                    await bucket.acquire()
+                    return await self.orchestrator.execute_action(
+                        framework=framework,
+                        action=action,
+                        params=params
+                    )
+            except RETRYABLE_ERRORS as e:
+                if attempt == attempts - 1:
+                    logger.error("%s.%s timed out after %d attempts: %s", framework, action, attempt + 1, e)
+                    raise
+                delay = min(ACTION_RETRY_MAX_DELAY, ACTION_RETRY_BASE_DELAY * 2 ** attempt)
+                logger.warning("%s.%s timed out (%s); retrying in %.2fs", framework, action, e, delay)
+                await asyncio.sleep(delay)
+    
     async def demonstrate_business_rule_patterns(self) -> None:
         """Demonstrate various business rule patterns."""
         logger.info("Demonstrating Business Rule Patterns")
@@ -437,7 +801,40 @@ class ReferenceImplementation:
         # Register and demonstrate rules
         for rule in [simple_rule, complex_rule, ml_rule]:
             self.rule_engine.register_rule(rule)
-            logger.info(f"Registered rule: {rule['name']}")
+            logger.info("Registered rule: %s", rule["name"])
+    
+    async def _run_benchmark(self, make_call, iterations: int) -> Dict[str, Any]:
+        """
+        Run ``iterations`` calls in concurrent windows and summarize latency.
+        
+        Args:
+            make_call: Function mapping an iteration index to a coroutine
+            iterations: Total number of calls to make
+            
+        Returns:
+            Mean, P50, P90, P99 and P99.9 latency in milliseconds plus
+            throughput
+        """
+        samples = []
+        start_ns = time.perf_counter_ns()
+        
+        for offset in range(0, iterations, BENCHMARK_WINDOW):
+            window = range(offset, min(offset + BENCHMARK_WINDOW, iterations))
+            samples.extend(await asyncio.gather(*(_timed(make_call(i)) for i in window)))
+        
+        elapsed_ns = time.perf_counter_ns() - start_ns
+        
+        # Per-mille cut points; inclusive keeps them within observed samples
+        cuts = statistics.quantiles(samples, n=1000, method="inclusive")
+        
+        return {
+            "average_latency_ms": statistics.fmean(samples) / 1e6,
+            "p50_latency_ms": cuts[499] / 1e6,
+            "p90_latency_ms": cuts[899] / 1e6,
+            "p99_latency_ms": cuts[989] / 1e6,
+            "p999_latency_ms": cuts[998] / 1e6,
+            "operations_per_second": iterations * 1e9 / elapsed_ns
+        }
     
     async def run_performance_benchmark(self) -> Dict[str, Any]:
         """Run performance benchmarks across all frameworks."""
@@ -446,66 +843,86 @@ class ReferenceImplementation:
         benchmarks = {}
         iterations = 100
         
-        # Benchmark each framework
+        # Benchmark each framework's health check
         for framework_name, adapter in self.adapters.items():
-            start_time = asyncio.get_event_loop().time()
-            
-            # Run simple operations
-            for i in range(iterations):
-                await self.orchestrator.execute_action(
-                    framework=framework_name,
-                    action="health_check",
-                    params={}
-                )
-            
-            end_time = asyncio.get_event_loop().time()
-            avg_time = (end_time - start_time) / iterations * 1000  # ms
-            
-            benchmarks[framework_name] = {
-                "average_latency_ms": avg_time,
-                "operations_per_second": iterations / (end_time - start_time)
-            }
+            benchmarks[framework_name] = await self._run_benchmark(
+                lambda i, adapter=adapter: adapter.health_check(),
+                iterations
+            )
         
         # Benchmark rule evaluation
-        rule_start = asyncio.get_event_loop().time()
-        for i in range(iterations):
-            await self.orchestrator.evaluate_rules(
+        rule_stats = await self._run_benchmark(
+            lambda i: self.orchestrator.evaluate_rules(
                 rule_set="performance_test",
                 context={"value": i}
-            )
-        rule_end = asyncio.get_event_loop().time()
-        
-        benchmarks["rule_evaluation"] = {
-            "average_latency_ms": (rule_end - rule_start) / iterations * 1000,
-            "evaluations_per_second": iterations / (rule_end - rule_start)
-        }
+            ),
+            iterations
+        )
+        rule_stats["evaluations_per_second"] = rule_stats.pop("operations_per_second")
+        benchmarks["rule_evaluation"] = rule_stats
         
-        logger.info(f"Benchmarks: {benchmarks}")
+        logger.info("Benchmarks: %s", benchmarks)
         return benchmarks
     
     async def shutdown(self) -> None:
         """Gracefully shutdown all components."""
         logger.info("Shutting down Reference Implementation")
         
-        # Disconnect all adapters
-        for name, adapter in self.adapters.items():
-            await adapter.disconnect()
-            logger.info(f"Disconnected {name} adapter")
-        
-        # Shutdown event bus
-        await self.event_bus.disconnect()
-        
-        # Save rule engine state
-        await self.rule_engine.save_state()
+        # Disconnect all adapters concurrently; one failing teardown must not
+        # keep the others connected
+        results = await asyncio.gather(
+            *(adapter.disconnect() for adapter in self.adapters.values()),
+            return_exceptions=True
+        )
+        for name, result in zip(self.adapters, results):
+            if isinstance(result, Exception):
+                logger.error("Error disconnecting %s adapter: %s", name, result)
+            else:
+                logger.info("Disconnected %s adapter", name)
+        
+        # Shutting down the event bus and saving rule engine state are
+        # independent of each other
+        await asyncio.gather(
+            self.event_bus.disconnect(),
+            self.rule_engine.save_state()
+        )
         
+        self._reset()
         logger.info("Reference Implementation shutdown complete")
+    
+    def _reset(self) -> None:
+        """Drop components and limits so the next call initializes again."""
+        self.orchestrator = None
+        self.event_bus = None
+        self.rule_engine = None
+        self.adapters = {}
+        self._framework_limits = {}
+        self._initialized = False
+
+
+@functools.cache
+def get_impl() -> ReferenceImplementation:
+    """Get the process-wide reference implementation, creating it on first use."""
+    return ReferenceImplementation()
+
+
+async def get_impl_async() -> ReferenceImplementation:
+    """
+    Get the process-wide reference implementation, initialized.
+    
+    Adapters, connection pools and loaded rules are set up on the first call
+    and reused by every later one; call this from request handlers (or once
+    at server startup) rather than constructing a new instance.
+    """
+    impl = get_impl()
+    await impl.ensure_initialized()
+    return impl
 
 
 async def main():
     """Run the reference implementation demonstrations."""
     # Initialize
-    implementation = ReferenceImplementation()
-    await implementation.initialize()
+    implementation = await get_impl_async()
     
     try:
         # Run demonstrations
@@ -92,7 +92,133 @@ class TestBusinessRule:
         # One condition not met
         assert rule.should_execute({"status": "active", "score": 40}) is False
         assert rule.should_execute({"status": "inactive", "score": 60}) is False
-        
+
+    def test_should_execute_checks_cheap_conditions_first(self):
+        """Test that cheap conditions short-circuit costlier ones."""
+        conditions = [
+            RuleCondition("customer.score", "gt", 50),
+            RuleCondition("status", "eq", "active")
+        ]
+        rule = BusinessRule(name="test_rule", conditions=conditions)
+
+        assert [c.field for c in rule.ordered_conditions()] == ["status", "customer.score"]
+
+        # The failing equality check stops evaluation before the missing
+        # nested field would be compared against a number
+        assert rule.should_execute({"status": "inactive"}) is False
+
+        # The cached order follows changes to the conditions list
+        rule.conditions.append(RuleCondition("region", "eq", "eu"))
+        assert [c.field for c in rule.ordered_conditions()] == ["status", "region", "customer.score"]
+
+        # Replacing a condition in place is picked up as well
+        rule.conditions[0] = RuleCondition("customer.score", "gt", 10)
+        assert rule.should_execute({"status": "active", "region": "eu", "customer": {"score": 20}}) is True
+
+    def test_should_execute_keeps_guard_semantics(self):
+        """Test that a comparison moved ahead of its guard does not raise."""
+        conditions = [
+            RuleCondition("meta.kind", "eq", "num"),
+            RuleCondition("val", "gt", 10)
+        ]
+        rule = BusinessRule(name="test_rule", conditions=conditions)
+        guarded = {"meta": {"kind": "str"}, "val": "abc"}
+
+        assert [c.field for c in rule.ordered_conditions()] == ["val", "meta.kind"]
+        assert rule.should_execute(guarded) is False
+        assert rule.should_execute({"meta": {"kind": "num"}, "val": 20}) is True
+        assert rule.evaluate_batch([guarded, {"meta": {"kind": "num"}, "val": 20}]) == [False, True]
+
+        # Errors the declared order reaches still surface
+        with pytest.raises(TypeError):
+            rule.should_execute({"meta": {"kind": "num"}, "val": "abc"})
+
+    def test_should_execute_reorders_by_selectivity(self):
+        """Test that frequently failing conditions move ahead of equal-cost ones."""
+        conditions = [
+            RuleCondition("region", "eq", "eu"),
+            RuleCondition("status", "eq", "active")
+        ]
+        rule = BusinessRule(name="test_rule", conditions=conditions)
+        rule.REORDER_INTERVAL = 4
+
+        for i in range(4):
+            assert rule.should_execute({"region": "eu", "status": f"pending_{i}"}) is False
+
+        assert [c.field for c in rule.ordered_conditions()] == ["status", "region"]
+        assert rule.should_execute({"region": "eu", "status": "active"}) is True
+
+    def test_reorder_keeps_guard_semantics(self):
+        """Test that reordering within a cost tier does not change results."""
+        conditions = [
+            RuleCondition("kind", "in", ["num"]),
+            RuleCondition("val", "gt", 10)
+        ]
+        rule = BusinessRule(name="test_rule", conditions=conditions)
+        rule.REORDER_INTERVAL = 8
+
+        # The comparison fails far more often than the guard, so it moves first
+        for i in range(8):
+            assert rule.should_execute({"kind": "num", "val": i}) is False
+
+        assert [c.operator for c in rule.ordered_conditions()] == ["gt", "in"]
+        assert rule.should_execute({"kind": "str", "val": "abc"}) is False
+
+    def test_should_execute_memoizes_on_condition_fields(self):
+        """Test that results are cached per condition field values."""
+        condition = RuleCondition("score", "gt", 50)
+        rule = BusinessRule(name="test_rule", conditions=[condition])
+
+        assert rule.should_execute({"score": 60, "request_id": 1}) is True
+        assert rule.should_execute({"score": 60, "request_id": 2}) is True
+        assert len(rule._cond_cache) == 1
+
+        # Equal values of different types are cached separately
+        flag_rule = BusinessRule(name="flag_rule", conditions=[RuleCondition("flag", "eq", 1)])
+        for flag in (1, 1.0, True):
+            assert flag_rule.should_execute({"flag": flag}) is True
+        assert len(flag_rule._cond_cache) == 3
+
+        # Unhashable values are evaluated without caching
+        list_rule = BusinessRule(name="list_rule", conditions=[RuleCondition("tags", "contains", "vip")])
+        assert list_rule.should_execute({"tags": ["vip"]}) is True
+
+        # In-place edits need an explicit invalidate
+        condition.value = 70
+        rule.invalidate()
+        assert rule.should_execute({"score": 60}) is False
+
+    def test_should_execute_cache_is_bounded(self):
+        """Test that the result cache evicts least recently used entries."""
+        rule = BusinessRule(name="test_rule", conditions=[RuleCondition("score", "gt", 50)])
+        rule.CONDITION_CACHE_SIZE = 2
+
+        rule.should_execute({"score": 1})
+        rule.should_execute({"score": 2})
+        rule.should_execute({"score": 1})
+        rule.should_execute({"score": 3})
+        assert list(rule._cond_cache) == [(1, int), (3, int)]
+
+        rule.cache_clear()
+        assert len(rule._cond_cache) == 0
+
+    def test_evaluate_batch(self):
+        """Test evaluating conditions across many contexts."""
+        conditions = [
+            RuleCondition("customer.score", "gt", 50),
+            RuleCondition("status", "eq", "active")
+        ]
+        rule = BusinessRule(name="test_rule", conditions=conditions)
+        contexts = [
+            {"status": "active", "customer": {"score": 60}},
+            {"status": "inactive"},
+            {"status": "active", "customer": {"score": 40}},
+        ]
+
+        assert rule.evaluate_batch(contexts) == [rule.should_execute(c) for c in contexts]
+        assert rule.evaluate_batch(contexts) == [True, False, False]
+        assert BusinessRule(name="always").evaluate_batch(contexts) == [True, True, True]
+
     def test_get_applicable_actions(self):
         """Test getting applicable actions for available frameworks."""
         actions = [
@@ -139,6 +265,7 @@ class TestBusinessRule:
     def test_from_dict(self):
         """Test creating rule from dictionary."""
         rule_data = {
+            "id": "rule-123",
             "name": "test_rule",
             "rule_type": "workflow",
             "priority": 10,
@@ -160,6 +287,7 @@ class TestBusinessRule:
         
         rule = BusinessRule.from_dict(rule_data)
         
+        assert rule.id == "rule-123"
         assert rule.name == "test_rule"
         assert rule.rule_type == RuleType.WORKFLOW
         assert rule.priority == RulePriority.HIGH
@@ -187,4 +315,28 @@ class TestRuleConflictResolver:
         assert resolved[0].name == "critical"
         assert resolved[1].name == "high"
         assert resolved[2].name == "medium"
-        assert resolved[3].name == "low_priority"
\ No newline at end of file
+        assert resolved[3].name == "low_priority"
+
+    def test_resolve_conflicts_top_k(self):
+        """Test selecting only the highest-priority rules."""
+        rules = [
+            BusinessRule("low_priority", priority=RulePriority.LOW),
+            BusinessRule("high", priority=RulePriority.HIGH),
+            BusinessRule("critical", priority=RulePriority.CRITICAL),
+            BusinessRule("also_high", priority=RulePriority.HIGH)
+        ]
+
+        resolved = RuleConflictResolver.resolve_conflicts(rules, top_k=3)
+
+        assert [r.name for r in resolved] == ["critical", "high", "also_high"]
+        assert resolved == RuleConflictResolver.resolve_conflicts(rules)[:3]
+
+    def test_resolve_conflicts_after_priority_change(self):
+        """Test that reassigning a priority updates the sort order."""
+        low = BusinessRule("low", priority=RulePriority.LOW)
+        high = BusinessRule("high", priority=RulePriority.HIGH)
+
+        low.priority = RulePriority.CRITICAL
+
+        assert RuleConflictResolver.resolve_conflicts([high, low]) == [low, high]
+        assert RulePriority.CRITICAL > RulePriority.HIGH
@@ -0,0 +1,104 @@
+"""Tests for MetaOrchestrator rule matching and health checks."""
+
+import asyncio
+
+from bizy.core.business_rule import BusinessRule, RuleCondition
+from bizy.core.framework_adapter import BaseFrameworkAdapter
+from bizy.core.meta_orchestrator import MetaOrchestrator
+
+
+class StubAdapter(BaseFrameworkAdapter):
+    """Adapter whose health check can be made to raise."""
+    
+    def __init__(self, name, error=None):
+        super().__init__(name, {})
+        self.error = error
+        
+    async def connect(self) -> None:
+        self.is_connected = True
+        
+    async def disconnect(self) -> None:
+        self.is_connected = False
+        
+    async def _execute_action(self, action, context):
+        return {}
+        
+    async def health_check(self):
+        if self.error is not None:
+            raise self.error
+        return await super().health_check()
+
+
+class TestRuleMatching:
+    """Test cases for registering and matching rules."""
+    
+    def test_match_rules_uses_field_index(self):
+        """Test that only rules whose key field is present are evaluated."""
+        orchestrator = MetaOrchestrator()
+        tier_rule = BusinessRule("tier", conditions=[RuleCondition("customer.tier", "eq", "premium")])
+        status_rule = BusinessRule("status", conditions=[RuleCondition("status", "eq", "active")])
+        score_rule = BusinessRule("score", conditions=[RuleCondition("score", "ne", 0)])
+        always_rule = BusinessRule("always")
+        
+        for rule in (tier_rule, status_rule, score_rule, always_rule):
+            orchestrator.register_rule(rule)
+            
+        assert orchestrator._rules_by_field == {"customer": [tier_rule], "status": [status_rule]}
+        
+        matched = orchestrator.match_rules({"customer": {"tier": "premium"}})
+        assert matched == [tier_rule, score_rule, always_rule]
+        
+        matched = orchestrator.match_rules({"status": "active", "score": 0})
+        assert matched == [status_rule, always_rule]
+        
+    def test_match_rules_batch(self):
+        """Test that batch matching agrees with per-context matching."""
+        orchestrator = MetaOrchestrator()
+        orchestrator.register_rule(BusinessRule("status", conditions=[
+            RuleCondition("status", "eq", "active"),
+            RuleCondition("score", "gt", 50)
+        ]))
+        orchestrator.register_rule(BusinessRule("region", conditions=[RuleCondition("region", "ne", "us")]))
+        contexts = [
+            {"status": "active", "score": 60, "region": "eu"},
+            {"status": "active", "score": 40, "region": "us"},
+            {"region": "apac"},
+            {}
+        ]
+        
+        batch = orchestrator.match_rules_batch(contexts)
+        
+        assert batch == [orchestrator.match_rules(c) for c in contexts]
+        assert [[r.name for r in rules] for rules in batch] == [["status", "region"], [], ["region"], ["region"]]
+        
+    def test_unregister_and_clear_rules(self):
+        """Test that removed rules are dropped from the index."""
+        orchestrator = MetaOrchestrator()
+        rule = BusinessRule("status", conditions=[RuleCondition("status", "eq", "active")])
+        
+        orchestrator.register_rule(rule)
+        orchestrator.register_rule(rule)
+        assert orchestrator.active_rules == [rule]
+        
+        orchestrator.unregister_rule(rule.id)
+        assert orchestrator.match_rules({"status": "active"}) == []
+        assert orchestrator._rules_by_field == {}
+        
+        orchestrator.register_rule(rule)
+        orchestrator.clear_rules()
+        assert orchestrator.match_rules({"status": "active"}) == []
+
+
+class TestHealthCheck:
+    """Test cases for orchestrator health checks."""
+    
+    async def test_health_check_reports_cancelled_adapter(self):
+        """Test that a cancelled adapter check is reported as unhealthy."""
+        orchestrator = MetaOrchestrator()
+        orchestrator.register_adapter("ok", StubAdapter("ok"))
+        orchestrator.register_adapter("cancelled", StubAdapter("cancelled", asyncio.CancelledError()))
+        
+        health = await orchestrator.health_check()
+        
+        assert health["adapters"]["ok"]["status"] == "disconnected"
+        assert health["adapters"]["cancelled"] == {"status": "unhealthy", "error": "CancelledError"}
@@ -0,0 +1,29 @@
+"""Tests for EventBus."""
+
+from bizy.events import EventBus, EventType
+
+
+class TestEventHistory:
+    """Test cases for event history queries."""
+    
+    async def test_get_event_history_limit(self):
+        """Test that the newest events are returned oldest first."""
+        bus = EventBus()
+        for i in range(5):
+            await bus.publish("tick", {"n": i})
+            
+        assert [e.data["n"] for e in bus.get_event_history(limit=2)] == [3, 4]
+        assert [e.data["n"] for e in bus.get_event_history(limit=0)] == [0, 1, 2, 3, 4]
+        
+    async def test_get_event_history_normalizes_event_type(self):
+        """Test that enum and string event types filter the same events."""
+        bus = EventBus()
+        await bus.publish(EventType.RULE_EXECUTION_STARTED, {"n": 1})
+        await bus.publish("rule_execution_started", {"n": 2})
+        await bus.publish("other", {"n": 3})
+        
+        by_enum = bus.get_event_history(EventType.RULE_EXECUTION_STARTED)
+        by_value = bus.get_event_history("rule_execution_started")
+        
+        assert [e.data["n"] for e in by_enum] == [1, 2]
+        assert by_enum == by_value